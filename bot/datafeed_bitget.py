@@ -4,9 +4,23 @@ import json
 import hmac
 import hashlib
 import base64
-from datetime import datetime, timezone
+from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson   # C encoder/decoder; works on bytes directly
+    _json_loads = orjson.loads
+
+    def _json_dumps_bytes(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps_bytes(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
 
 # ======================
 # Bitget config
@@ -15,6 +29,7 @@ import requests
 BITGET_API_KEY = os.environ.get("BITGET_API_KEY", "")
 BITGET_API_SECRET = os.environ.get("BITGET_API_SECRET", "")
 BITGET_API_PASSPHRASE = os.environ.get("BITGET_API_PASSPHRASE", "")
+_BITGET_SECRET_BYTES = BITGET_API_SECRET.encode()   # encoded once, not per signature
 
 BITGET_BASE_URL = "https://api.bitget.com"
 
@@ -35,12 +50,29 @@ BITGET_SYMBOLS = [
 if not BITGET_SYMBOLS:
     BITGET_SYMBOLS = [BITGET_SYMBOL]
 
+# One keep-alive session for every Bitget call (both accounts, public ticker):
+# pollers hit the same host every few seconds, so reuse the TCP+TLS socket
+# instead of a fresh handshake per request. Transient 429/5xx on GETs are
+# retried; POSTs (orders) are never replayed.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+        raise_on_status=False,
+    ),
+))
+
 # ======================
 # Helpers
 # ======================
 
 def iso_utc_now() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
 
 
 def _pnl_color(pnl: float) -> str:
@@ -80,10 +112,10 @@ def _signed_request(method: str, request_path: str,
     query = ""
 
     if params:
-        from urllib.parse import urlencode
         query = urlencode(params)
 
-    body_str = json.dumps(body, separators=(",", ":")) if body else ""
+    body_bytes = _json_dumps_bytes(body) if body else b""
+    body_str   = body_bytes.decode()   # prehash needs str; the POST sends the same bytes
 
     if query:
         prehash = timestamp + method + request_path + "?" + query + body_str
@@ -93,7 +125,7 @@ def _signed_request(method: str, request_path: str,
         url = f"{BITGET_BASE_URL}{request_path}"
 
     sign = hmac.new(
-        BITGET_API_SECRET.encode(),
+        _BITGET_SECRET_BYTES,
         prehash.encode(),
         hashlib.sha256
     ).digest()
@@ -107,14 +139,14 @@ def _signed_request(method: str, request_path: str,
     }
 
     if method == "GET":
-        r = requests.get(url, headers=headers, timeout=10)
+        r = SESSION.get(url, headers=headers, timeout=10)
     else:
-        r = requests.post(url, headers=headers, data=body_str, timeout=10)
+        r = SESSION.post(url, headers=headers, data=body_bytes, timeout=10)
 
     if r.status_code != 200:
         raise RuntimeError(f"Bitget HTTP {r.status_code}: {r.text}")
 
-    data = r.json()
+    data = _json_loads(r.content)
     if data.get("code") != "00000":
         raise RuntimeError(f"Bitget API error {data.get('code')}: {data.get('msg')}")
 
@@ -130,8 +162,8 @@ def get_ticker(symbol: str):
     """
     try:
         url = f"{BITGET_BASE_URL}/api/v2/mix/market/ticker"
-        resp = requests.get(url, params={"symbol": symbol}, timeout=5)
-        data = resp.json()
+        resp = SESSION.get(url, params={"symbol": symbol}, timeout=5)
+        data = _json_loads(resp.content)
 
         if data.get("code") != "00000":
             print("[Bitget] get_ticker error:", data)
@@ -541,6 +573,7 @@ def build_positions_and_orders_message(symbols: list[str] | None = None) -> str:
 ELITE_API_KEY        = os.environ.get("ELITE_API_KEY", "")
 ELITE_API_SECRET     = os.environ.get("ELITE_API_SECRET", "")
 ELITE_API_PASSPHRASE = os.environ.get("ELITE_API_PASSPHRASE", "")
+_ELITE_SECRET_BYTES  = ELITE_API_SECRET.encode()
 
 
 def _signed_request_elite(method: str, request_path: str,
@@ -555,10 +588,10 @@ def _signed_request_elite(method: str, request_path: str,
     query     = ""
 
     if params:
-        from urllib.parse import urlencode
         query = urlencode(params)
 
-    body_str = json.dumps(body, separators=(",", ":")) if body else ""
+    body_bytes = _json_dumps_bytes(body) if body else b""
+    body_str   = body_bytes.decode()   # prehash needs str; the POST sends the same bytes
 
     if query:
         prehash = timestamp + method + request_path + "?" + query + body_str
@@ -568,7 +601,7 @@ def _signed_request_elite(method: str, request_path: str,
         url     = f"{BITGET_BASE_URL}{request_path}"
 
     sign = hmac.new(
-        ELITE_API_SECRET.encode(),
+        _ELITE_SECRET_BYTES,
         prehash.encode(),
         hashlib.sha256
     ).digest()
@@ -582,14 +615,14 @@ def _signed_request_elite(method: str, request_path: str,
     }
 
     if method == "GET":
-        r = requests.get(url, headers=headers, timeout=10)
+        r = SESSION.get(url, headers=headers, timeout=10)
     else:
-        r = requests.post(url, headers=headers, data=body_str, timeout=10)
+        r = SESSION.post(url, headers=headers, data=body_bytes, timeout=10)
 
     if r.status_code != 200:
         raise RuntimeError(f"Elite Bitget HTTP {r.status_code}: {r.text}")
 
-    data = r.json()
+    data = _json_loads(r.content)
     if data.get("code") != "00000":
         raise RuntimeError(f"Elite Bitget API error {data.get('code')}: {data.get('msg')}")
 
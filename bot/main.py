@@ -18,10 +18,13 @@ import sys
 import json
 import logging
 import platform
+import signal
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 
+import requests
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.events import EVENT_JOB_ERROR
 
@@ -47,6 +50,8 @@ import bot.modules.optionswatch    as optionswatch
 import bot.modules.vixwatch        as vixwatch
 import bot.modules.intelwatch      as intelwatch
 import bot.modules.reportwatch     as reportwatch
+import bot.modules.weeklybrief     as weeklybrief
+import bot.modules.strategyrecap   as strategyrecap
 
 log = logging.getLogger("main")
 
@@ -60,16 +65,26 @@ STARTED_AT_UTC = datetime.now(timezone.utc)
 PUBLIC_CHAT_ID = os.getenv("PUBLIC_CHAT_ID", "")
 ADMIN_USER_ID  = os.getenv("ADMIN_USER_ID", "")   # Telegram user ID — /monthly_update restricted to this
 
+# Small shared pool for independent network fetches inside one job/command
+_FETCH_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="main_fetch")
+
 # ─── PositionWatch state ─────────────────────────────────────────────────────
 # Tracks last known snapshot per symbol so we can detect changes.
 # Initialised as None — first poll just seeds the baseline, no alerts.
 from bot.datafeed_bitget import (
     _fetch_current_futures_position,
     _fetch_pending_tp_sl_orders,
+    _fetch_current_futures_position_elite,
+    _fetch_pending_tp_sl_orders_elite,
     _position_is_open,
+    _signed_request,
     _to_float,
+    get_ticker,
     iso_utc_now,
+    BITGET_API_KEY,
+    BITGET_PRODUCT_TYPE,
     BITGET_SYMBOLS,
+    ELITE_API_KEY,
 )
 
 _POS_SNAPSHOT: dict = {}   # { "BTCUSDT": { has_position, side, size, entry, tp, sl }, ... }
@@ -127,21 +142,30 @@ def _job_trumpwatch():
 def _job_fedwatch():
     try:
         fedwatch.poll_once()
+        _arm_fedwatch_alert()
     except Exception as e:
         _err("FedWatch", e)
 
+def _arm_fedwatch_alert():
+    """One-shot job at the next alert's exact time; the 5-min poll alone fires up to 5 min late."""
+    ts = fedwatch.next_alert_ts()
+    if ts is None:
+        return
+    SCHED.add_job(
+        _job_fedwatch, "date", run_date=datetime.fromtimestamp(ts, timezone.utc),
+        id="fedwatch_next", replace_existing=True, misfire_grace_time=60,
+    )
+
 def _job_weekly_brief():
     try:
-        from bot.modules.weeklybrief import send_weekly_brief
-        send_weekly_brief(_get_modules())
+        weeklybrief.send_weekly_brief(_get_modules())
     except Exception as e:
         _err("WeeklyBrief", e)
 
 
 def _job_strategy_recap():
     try:
-        from bot.modules.strategyrecap import send_strategy_recap
-        send_strategy_recap()
+        strategyrecap.send_strategy_recap()
     except Exception as e:
         _err("StrategyRecap", e)
 
@@ -190,15 +214,6 @@ def _poll_positions():
     """
     global _POS_INITIALISED, _POS_SNAPSHOT
 
-    from bot.datafeed_bitget import (
-        _fetch_current_futures_position,
-        _fetch_pending_tp_sl_orders,
-        _fetch_current_futures_position_elite,
-        _fetch_pending_tp_sl_orders_elite,
-        BITGET_API_KEY,
-        ELITE_API_KEY,
-    )
-
     accounts = []
     if BITGET_API_KEY:
         accounts.append({
@@ -276,7 +291,6 @@ def _poll_positions():
 
                     # Fetch last price for PnL estimate
                     try:
-                        from bot.datafeed_bitget import get_ticker
                         last_px = get_ticker(sym) or 0.0
                     except Exception:
                         last_px = 0.0
@@ -393,11 +407,6 @@ def _send_weekly_perf():
     Pulls closed trades from Bitget for the past 7 days and summarises results.
     Falls back to ETH price change if no API credentials.
     """
-    from bot.datafeed_bitget import (
-        _signed_request, _to_float,
-        BITGET_PRODUCT_TYPE, BITGET_API_KEY
-    )
-
     sym = os.getenv("INFINEX_SYMBOL", "ETHUSDT")
     now = datetime.now(timezone.utc)
     week_start_dt = now - timedelta(days=7)
@@ -514,11 +523,6 @@ def _send_monthly_perf():
     First Monday of each month at 09:30 — 30-day closed trade recap.
     Personal trading performance only — no strategy names or links.
     """
-    from bot.datafeed_bitget import (
-        _signed_request, _to_float,
-        BITGET_PRODUCT_TYPE, BITGET_API_KEY
-    )
-
     sym = os.getenv("INFINEX_SYMBOL", "ETHUSDT")
     now = datetime.now(timezone.utc)
     month_start_dt  = now - timedelta(days=30)
@@ -705,8 +709,6 @@ def _job_market_open():
 
 def _send_market_open():
     """Mon–Fri 14:30 CET — US market open snapshot."""
-    from bot.datafeed_bitget import BITGET_PRODUCT_TYPE
-
     def _ticker(sym):
         try:
             r = requests.get(
@@ -732,8 +734,10 @@ def _send_market_open():
         except Exception:
             return None
 
-    btc = _ticker("BTCUSDT")
-    eth = _ticker("ETHUSDT")
+    # Independent round-trips: fetch both at once
+    btc_fut = _FETCH_POOL.submit(_ticker, "BTCUSDT")
+    eth_fut = _FETCH_POOL.submit(_ticker, "ETHUSDT")
+    btc, eth = btc_fut.result(), eth_fut.result()
     now = datetime.now(timezone.utc)
 
     if not btc and not eth:
@@ -953,27 +957,6 @@ def _fmt_uptime() -> str:
     h, rem = divmod(int(delta.total_seconds()), 3600)
     return f"{h:02d}:{rem // 60:02d}:{rem % 60:02d}"
 
-def _compute_levels_from_candles(candles, lookback=48):
-    if not candles:
-        return None
-    lb = candles[-lookback:] if len(candles) > lookback else candles
-    return {
-        "support":    min(c["low"]   for c in lb),
-        "resistance": max(c["high"]  for c in lb),
-        "last":       candles[-1]["close"],
-    }
-
-def _atr_simple(candles, period=14):
-    if len(candles) < period + 1:
-        return 0.0
-    trs = [
-        max(candles[i]["high"] - candles[i]["low"],
-            abs(candles[i]["high"] - candles[i-1]["close"]),
-            abs(candles[i]["low"]  - candles[i-1]["close"]))
-        for i in range(-period, 0)
-    ]
-    return sum(trs) / len(trs) if trs else 0.0
-
 
 
 
@@ -1087,20 +1070,47 @@ def _build_health_msg() -> str:
 
 # ─── Command loop ─────────────────────────────────────────────────────────────
 
+# Static part of the new-member greeting (only the mention changes)
+_WELCOME_TEXT = (
+    "You just joined Infinex Capital HQ —\n"
+    "home of ATRb v2, a fully automated trading strategy\n"
+    "running 24/7 on ETH (4H timeframe).\n\n"
+    "No charts. No noise. No emotion.\n"
+    "Just the system doing its work.\n\n"
+    "━━━━━━━━━━━━━━━━━━━━━━━━\n"
+    "Here's what to do:\n\n"
+    "1. Read the pinned message\n"
+    "2. Type /status to see the strategy live\n"
+    "3. Type /bot_challenge for the ATRb v2 $1k → $100k journey\n"
+    "4. Activate copy trading on Bitget to mirror every trade\n\n"
+    "━━━━━━━━━━━━━━━━━━━━━━━━\n"
+    "🚀 Copy trading live May 1, 2026\n"
+    "https://www.bitget.com/copy-trading/futures-trader-v1/bcb7467487b53c5fa395?clacCode=4Y4MLFF1"
+)
+
+
 def command_loop():
     offset     = None
     chat_allow = str(os.getenv("CHAT_ID") or "")
+    failures   = 0   # consecutive getUpdates failures → exponential backoff
 
     while True:
         try:
-            data = get_updates(offset=offset, timeout=20)
+            # 50s long-poll (Telegram allows up to ~60) halves idle round-trips;
+            # only messages are handled (joins arrive as messages too), so
+            # let Telegram drop callback queries and other update types
+            data = get_updates(offset=offset, timeout=50, allowed_updates=["message"])
+            if not data.get("ok"):
+                # get_updates returns immediately on errors; without a pause a
+                # Telegram outage (or a missing token) turns this into a busy loop
+                failures += 1
+                time.sleep(min(60, 2 ** failures))
+                continue
+            failures = 0
+
             for upd in data.get("result", []):
                 offset   = upd["update_id"] + 1
 
-                # Button taps ignored: the approve/skip execution loop is gone.
-                if upd.get("callback_query"):
-                    continue
-
                 msg      = upd.get("message") or {}
                 text_raw = (msg.get("text") or "").strip()
                 if not text_raw:
@@ -1118,329 +1128,205 @@ def command_loop():
                     username = member.get("username")
                     first    = member.get("first_name", "")
                     mention  = f"@{username}" if username else first
-                    send_text(
-                        f"🤖 Welcome {mention}!\n\n"
-                        f"You just joined Infinex Capital HQ —\n"
-                        f"home of ATRb v2, a fully automated trading strategy\n"
-                        f"running 24/7 on ETH (4H timeframe).\n\n"
-                        f"No charts. No noise. No emotion.\n"
-                        f"Just the system doing its work.\n\n"
-                        f"━━━━━━━━━━━━━━━━━━━━━━━━\n"
-                        f"Here's what to do:\n\n"
-                        f"1. Read the pinned message\n"
-                        f"2. Type /status to see the strategy live\n"
-                        f"3. Type /bot_challenge for the ATRb v2 $1k → $100k journey\n"
-                        f"4. Activate copy trading on Bitget to mirror every trade\n\n"
-                        f"━━━━━━━━━━━━━━━━━━━━━━━━\n"
-                        f"🚀 Copy trading live May 1, 2026\n"
-                        f"https://www.bitget.com/copy-trading/futures-trader-v1/bcb7467487b53c5fa395?clacCode=4Y4MLFF1"
-                    )
+                    send_text(f"🤖 Welcome {mention}!\n\n" + _WELCOME_TEXT)
 
                 if not text:
                     continue
 
                 try:
-                    _handle_command(text, text_raw)
+                    _handle_command(text, text_raw, msg)
                 except Exception as e:
                     send_text(f"⚠️ Command error: {str(e)[:200]}")
 
         except Exception as e:
             # Never let the command loop die — log and keep going
             print(f"[command_loop] Error: {e}", flush=True)
-            time.sleep(5)
-
-
-def _handle_command(text: str, text_raw: str):
-
-
-    # ── /help ────────────────────────────────────────────────────────────────
-    if text.startswith("/help"):
-        send_text(
-            "🤖 *MacroWatch — Command Guide*\n\n"
-            "🍊 *TrumpWatch*\n"
-            "`/trumpwatch` — Trigger immediate live poll\n"
-            "`/tw_recent` — Last 10 alerts\n"
-            "`/tw_diag` — Source health + dedup stats\n"
-            "`/tw_clear` — Clear dedup cache (re-enables old posts)\n\n"
-            "🏦 *FedWatch*\n"
-            "`/fedwatch` — Next Fed event\n"
-            "`/fed_diag` — Calendar + rate probability\n\n"
-            "📊 *MacroWatch Weekly*\n"
-            "`/weekly` — Full weekly market brief (private)\n"
-            "`/pulse` — Investor weekly pulse (preview)\n"
-            "`/monthly_update` — Send monthly investor update (admin only)\n\n"
-            "📅 *Daily Briefs*\n"
-            "`/morning` — Morning brief on demand\n"
-            "`/evening` — Evening recap on demand\n\n"
-            "📡 *CorrelWatch*\n"
-            "`/correl_diag` — DXY vs BTC last reading\n\n"
-            "💸 *FundingWatch*\n"
-            "`/funding_diag` — Current funding rates\n\n"
-            "📊 *OIWatch*\n"
-            "`/oi_diag` — Current open interest\n\n"
-            "⚙️ *OptionsWatch*\n"
-            "`/options_diag` — Last expiry analysis\n"
-            "`/options_now` — Run analysis now\n\n"
-            "🧠 *IntelWatch*\n"
-            "`/intel` — Full market intelligence briefing\n\n"
-            "😱 *VixWatch*\n"
-            "`/vix` — Current VIX reading + market context\n"
-            "`/vix_diag` — Last value + alert state\n\n"
-            "🩺 *System*\n"
-            "`/health` — Full system status\n"
-            "`/restart` — Trigger clean poll of all modules\n"
-            "`/status` — ATRb v2 live strategy status (indicators + regime)\n"
-            "`/bot_challenge` — ATRb v2 $1k → $100k progress\n"
-            "`/live_challenge` — TraderWatch $1k → $10k progress\n"
-            "`/report` — Last 7 days trades + P&L\n"
-        )
-        return
-
-    # ── /health ───────────────────────────────────────────────────────────────
-    if text.startswith("/health"):
-        send_text(_build_health_msg())
-        return
-
-    # ── /restart ──────────────────────────────────────────────────────────────
-    if text.startswith("/restart"):
-        send_text("🔄 Triggering clean poll of all modules...")
-        results = []
-        for label, fn in [
-            ("TrumpWatch", _job_trumpwatch),
-            ("FedWatch",   _job_fedwatch),
-        ]:
-            try:
-                fn()
-                results.append(f"✅ {label}")
-            except Exception as e:
-                results.append(f"❌ {label}: {str(e)[:80]}")
-        send_text("🔄 Poll complete:\n" + "\n".join(results))
-        return
-
-    # ── /tw_diag ──────────────────────────────────────────────────────────────
-    if text.startswith("/tw_diag"):
-        try:
-            trumpwatch_live.run_diag()
-        except Exception as e:
-            send_text(f"🍊 [TrumpWatch] Diag error: {e}")
-        return
-
-    # ── /tw_clear ─────────────────────────────────────────────────────────────
-    if text.startswith("/tw_clear"):
-        try:
-            mem_count   = len(trumpwatch_live.STATE["seen"])
-            trumpwatch_live.STATE["seen"].clear()
-            redis_count = trumpwatch_live._redis_flush()
-            total       = mem_count + redis_count
-            send_text(
-                f"🍊 [TrumpWatch] Dedup cache cleared\n"
-                f"• Memory: {mem_count} entries removed\n"
-                f"• Redis: {redis_count} keys deleted\n"
-                f"Next poll will re-evaluate all recent posts."
-            )
-        except Exception as e:
-            send_text(f"🍊 [TrumpWatch] Clear error: {e}")
-        return
-
-    # ── /trumpwatch ───────────────────────────────────────────────────────────
-    if text.startswith("/trumpwatch"):
-        try:
-            trumpwatch_live.poll_once()
-            send_text("🍊 [TrumpWatch] Live poll executed.")
-        except Exception as e:
-            send_text(f"🍊 [TrumpWatch] Poll error: {e}")
-        return
-
-    if text.startswith("/tw_recent"):
-        try:
-            trumpwatch_live.show_recent()
-        except Exception as e:
-            send_text(f"🍊 [TrumpWatch] Recent error: {e}")
-        return
-
-    if text.startswith("/tw_sentiment"):
-        try:
-            trumpwatch_live.show_sentiment()
-        except Exception as e:
-            send_text(f"🍊 [TrumpWatch] Sentiment error: {e}")
-        return
-
-    # ── /fedwatch ─────────────────────────────────────────────────────────────
-    if text.startswith("/fedwatch"):
-        fedwatch.show_next_event()
-        return
+            failures += 1
+            time.sleep(min(60, 2 ** failures))
+
+
+_HELP_TEXT = (
+    "🤖 *MacroWatch — Command Guide*\n\n"
+    "🍊 *TrumpWatch*\n"
+    "`/trumpwatch` — Trigger immediate live poll\n"
+    "`/tw_recent` — Last 10 alerts\n"
+    "`/tw_diag` — Source health + dedup stats\n"
+    "`/tw_clear` — Clear dedup cache (re-enables old posts)\n\n"
+    "🏦 *FedWatch*\n"
+    "`/fedwatch` — Next Fed event\n"
+    "`/fed_diag` — Calendar + rate probability\n\n"
+    "📊 *MacroWatch Weekly*\n"
+    "`/weekly` — Full weekly market brief (private)\n"
+    "`/pulse` — Investor weekly pulse (preview)\n"
+    "`/monthly_update` — Send monthly investor update (admin only)\n\n"
+    "📅 *Daily Briefs*\n"
+    "`/morning` — Morning brief on demand\n"
+    "`/evening` — Evening recap on demand\n\n"
+    "📡 *CorrelWatch*\n"
+    "`/correl_diag` — DXY vs BTC last reading\n\n"
+    "💸 *FundingWatch*\n"
+    "`/funding_diag` — Current funding rates\n\n"
+    "📊 *OIWatch*\n"
+    "`/oi_diag` — Current open interest\n\n"
+    "⚙️ *OptionsWatch*\n"
+    "`/options_diag` — Last expiry analysis\n"
+    "`/options_now` — Run analysis now\n\n"
+    "🧠 *IntelWatch*\n"
+    "`/intel` — Full market intelligence briefing\n\n"
+    "😱 *VixWatch*\n"
+    "`/vix` — Current VIX reading + market context\n"
+    "`/vix_diag` — Last value + alert state\n\n"
+    "🩺 *System*\n"
+    "`/health` — Full system status\n"
+    "`/restart` — Trigger clean poll of all modules\n"
+    "`/status` — ATRb v2 live strategy status (indicators + regime)\n"
+    "`/bot_challenge` — ATRb v2 $1k → $100k progress\n"
+    "`/live_challenge` — TraderWatch $1k → $10k progress\n"
+    "`/report` — Last 7 days trades + P&L\n"
+)
 
-    if text.startswith("/fed_diag"):
-        fedwatch.show_diag()
-        return
 
-    # ── /weekly ───────────────────────────────────────────────────────────────
-    if text.startswith("/weekly"):
+def _guarded(fn, err_label: str, ack: str | None = None):
+    """Command handler that runs fn(), optionally after an ack, and reports errors."""
+    def _run(text_raw: str, msg: dict):
         try:
-            send_text("📊 Building weekly brief — takes ~15s...")
-            from bot.modules.weeklybrief import send_weekly_brief
-            send_weekly_brief(_get_modules())
+            if ack:
+                send_text(ack)
+            fn()
         except Exception as e:
-            send_text(f"📊 [WeeklyBrief] Error: {e}")
-        return
+            send_text(f"{err_label}: {e}")
+    return _run
 
-    # ── /pulse — investor weekly pulse (on-demand preview) ───────────────────
-    if text.startswith("/pulse"):
-        try:
-            from bot.modules.weeklybrief import build_weekly_pulse
-            send_text(build_weekly_pulse(_get_modules()))
-        except Exception as e:
-            send_text(f"⚡ [Pulse] Error: {e}")
-        return
 
-    # ── /morning — on-demand morning brief ───────────────────────────────────
-    if text.startswith("/morning"):
-        try:
-            dailybrief.send_morning_brief(_get_modules())
-        except Exception as e:
-            send_text(f"🌅 [Morning] Error: {e}")
-        return
+def _cmd_help(text_raw: str, msg: dict):
+    send_text(_HELP_TEXT)
 
-    # ── /evening — on-demand evening recap ───────────────────────────────────
-    if text.startswith("/evening"):
-        try:
-            dailybrief.send_evening_recap(_get_modules())
-        except Exception as e:
-            send_text(f"🌙 [Evening] Error: {e}")
-        return
 
-    # ── /monthly_update [outlook text] — admin only ───────────────────────────
-    if text.startswith("/monthly_update"):
-        user_id = str(upd.get("message", {}).get("from", {}).get("id", ""))
-        if ADMIN_USER_ID and user_id != ADMIN_USER_ID:
-            send_text("⚠️ This command is restricted.")
-            return
-        try:
-            parts    = text_raw.split(None, 1)
-            outlook  = parts[1].strip() if len(parts) > 1 else ""
-            if not outlook:
-                send_text("Usage: `/monthly_update Your outlook paragraph here`")
-                return
-            from bot.modules.weeklybrief import build_monthly_update, _send_public
-            msg = build_monthly_update(_get_modules(), outlook)
-            send_text(msg)
-            _send_public(msg)
-        except Exception as e:
-            send_text(f"📊 [MonthlyUpdate] Error: {e}")
-        return
+def _cmd_health(text_raw: str, msg: dict):
+    send_text(_build_health_msg())
 
-    # ── /correl_diag ─────────────────────────────────────────────────────────
-    if text.startswith("/correl_diag"):
-        try:
-            correlwatch.show_diag()
-        except Exception as e:
-            send_text(f"📡 [CorrelWatch] Diag error: {e}")
-        return
 
-    # ── /funding_diag ─────────────────────────────────────────────────────────
-    if text.startswith("/funding_diag"):
+def _cmd_restart(text_raw: str, msg: dict):
+    send_text("🔄 Triggering clean poll of all modules...")
+    results = []
+    for label, fn in [
+        ("TrumpWatch", _job_trumpwatch),
+        ("FedWatch",   _job_fedwatch),
+    ]:
         try:
-            fundingwatch.show_diag()
+            fn()
+            results.append(f"✅ {label}")
         except Exception as e:
-            send_text(f"💸 [FundingWatch] Diag error: {e}")
-        return
+            results.append(f"❌ {label}: {str(e)[:80]}")
+    send_text("🔄 Poll complete:\n" + "\n".join(results))
 
-    # ── /oi_diag ──────────────────────────────────────────────────────────────
-    if text.startswith("/oi_diag"):
-        try:
-            oiwatch.show_diag()
-        except Exception as e:
-            send_text(f"📊 [OIWatch] Diag error: {e}")
-        return
 
-    # ── /options_diag / /options_now ─────────────────────────────────────────
-    if text.startswith("/options_now"):
-        try:
-            send_text("⚙️ Running options analysis — takes ~30s...")
-            optionswatch.run_thursday()
-        except Exception as e:
-            send_text(f"⚙️ [OptionsWatch] Error: {e}")
-        return
+def _cmd_tw_clear(text_raw: str, msg: dict):
+    try:
+        mem_count   = len(trumpwatch_live.STATE["seen"])
+        trumpwatch_live.STATE["seen"].clear()
+        redis_count = trumpwatch_live._redis_flush()
+        total       = mem_count + redis_count
+        send_text(
+            f"🍊 [TrumpWatch] Dedup cache cleared\n"
+            f"• Memory: {mem_count} entries removed\n"
+            f"• Redis: {redis_count} keys deleted\n"
+            f"Next poll will re-evaluate all recent posts."
+        )
+    except Exception as e:
+        send_text(f"🍊 [TrumpWatch] Clear error: {e}")
 
-    if text.startswith("/options_diag"):
-        try:
-            optionswatch.show_diag()
-        except Exception as e:
-            send_text(f"⚙️ [OptionsWatch] Diag error: {e}")
-        return
 
-    # ── /intel ────────────────────────────────────────────────────────────────
-    if text.startswith("/intel"):
-        try:
-            send_text("🧠 Compiling full market briefing...")
-            intelwatch.show_intel(_get_modules())
-        except Exception as e:
-            send_text(f"🧠 [IntelWatch] Error: {e}")
-        return
+def _cmd_trumpwatch(text_raw: str, msg: dict):
+    try:
+        trumpwatch_live.poll_once()
+        send_text("🍊 [TrumpWatch] Live poll executed.")
+    except Exception as e:
+        send_text(f"🍊 [TrumpWatch] Poll error: {e}")
 
-    # ── /vix / /vix_diag ─────────────────────────────────────────────────────
-    if text.startswith("/vix_diag"):
-        try:
-            vixwatch.show_diag()
-        except Exception as e:
-            send_text(f"😱 [VixWatch] Diag error: {e}")
-        return
 
-    if text.startswith("/vix"):
-        try:
-            vixwatch.show_vix()
-        except Exception as e:
-            send_text(f"😱 [VixWatch] Error: {e}")
-        return
+def _cmd_weekly(text_raw: str, msg: dict):
+    try:
+        send_text("📊 Building weekly brief — takes ~15s...")
+        weeklybrief.send_weekly_brief(_get_modules())
+    except Exception as e:
+        send_text(f"📊 [WeeklyBrief] Error: {e}")
 
-    # ── /status ───────────────────────────────────────────────────────────────
-    if text.startswith("/status"):
-        try:
-            send_text("🤖 Fetching strategy status...")
-            stratwatch.show_status()
-        except Exception as e:
-            send_text(f"🤖 [StratWatch] Error: {e}")
-        return
 
-    # ── /challenge_diag (must come first - longest prefix wins) ──────────────
-    if text.startswith("/challenge_diag"):
-        try:
-            challengewatch.show_challenge_diag()
-        except Exception as e:
-            send_text(f"🎯 [Diag] Error: {e}")
-        return
+def _cmd_pulse(text_raw: str, msg: dict):
+    try:
+        send_text(weeklybrief.build_weekly_pulse(_get_modules()))
+    except Exception as e:
+        send_text(f"⚡ [Pulse] Error: {e}")
 
-    # ── /bot_challenge → ATRb v2 systematic ($1k → $100k) ─────────────────────
-    if text.startswith("/bot_challenge"):
-        try:
-            challengewatch.show_bot_challenge()
-        except Exception as e:
-            send_text(f"🤖 [Bot Challenge] Error: {e}")
-        return
 
-    # ── /live_challenge → TraderWatch discretionary ($1k → $10k) ───────────────────
-    if text.startswith("/live_challenge"):
-        try:
-            challengewatch.show_live_challenge()
-        except Exception as e:
-            send_text(f"🎯 [Live Challenge] Error: {e}")
+def _cmd_monthly_update(text_raw: str, msg: dict):
+    """/monthly_update [outlook text] — admin only."""
+    user_id = str((msg.get("from") or {}).get("id", ""))
+    if ADMIN_USER_ID and user_id != ADMIN_USER_ID:
+        send_text("⚠️ This command is restricted.")
         return
+    try:
+        parts    = text_raw.split(None, 1)
+        outlook  = parts[1].strip() if len(parts) > 1 else ""
+        if not outlook:
+            send_text("Usage: `/monthly_update Your outlook paragraph here`")
+            return
+        msg_text = weeklybrief.build_monthly_update(_get_modules(), outlook)
+        send_text(msg_text)
+        weeklybrief._send_public(msg_text)
+    except Exception as e:
+        send_text(f"📊 [MonthlyUpdate] Error: {e}")
+
+
+# Exact command → handler. Built once; dispatch is a single dict lookup.
+COMMANDS = {
+    "/help":           _cmd_help,
+    "/health":         _cmd_health,
+    "/restart":        _cmd_restart,
+    # TrumpWatch
+    "/tw_diag":        _guarded(lambda: trumpwatch_live.run_diag(),       "🍊 [TrumpWatch] Diag error"),
+    "/tw_clear":       _cmd_tw_clear,
+    "/trumpwatch":     _cmd_trumpwatch,
+    "/tw_recent":      _guarded(lambda: trumpwatch_live.show_recent(),    "🍊 [TrumpWatch] Recent error"),
+    "/tw_sentiment":   _guarded(lambda: trumpwatch_live.show_sentiment(), "🍊 [TrumpWatch] Sentiment error"),
+    # FedWatch
+    "/fedwatch":       _guarded(lambda: fedwatch.show_next_event(), "🏦 [FedWatch] Error"),
+    "/fed_diag":       _guarded(lambda: fedwatch.show_diag(),       "🏦 [FedWatch] Diag error"),
+    # Briefs
+    "/weekly":         _cmd_weekly,
+    "/pulse":          _cmd_pulse,
+    "/morning":        _guarded(lambda: dailybrief.send_morning_brief(_get_modules()), "🌅 [Morning] Error"),
+    "/evening":        _guarded(lambda: dailybrief.send_evening_recap(_get_modules()), "🌙 [Evening] Error"),
+    "/monthly_update": _cmd_monthly_update,
+    # Diagnostics
+    "/correl_diag":    _guarded(lambda: correlwatch.show_diag(),  "📡 [CorrelWatch] Diag error"),
+    "/funding_diag":   _guarded(lambda: fundingwatch.show_diag(), "💸 [FundingWatch] Diag error"),
+    "/oi_diag":        _guarded(lambda: oiwatch.show_diag(),      "📊 [OIWatch] Diag error"),
+    "/options_now":    _guarded(lambda: optionswatch.run_thursday(), "⚙️ [OptionsWatch] Error",
+                                ack="⚙️ Running options analysis — takes ~30s..."),
+    "/options_diag":   _guarded(lambda: optionswatch.show_diag(), "⚙️ [OptionsWatch] Diag error"),
+    "/intel":          _guarded(lambda: intelwatch.show_intel(_get_modules()), "🧠 [IntelWatch] Error",
+                                ack="🧠 Compiling full market briefing..."),
+    "/vix_diag":       _guarded(lambda: vixwatch.show_diag(), "😱 [VixWatch] Diag error"),
+    "/vix":            _guarded(lambda: vixwatch.show_vix(),  "😱 [VixWatch] Error"),
+    # Strategy / challenges
+    "/status":         _guarded(lambda: stratwatch.show_status(), "🤖 [StratWatch] Error",
+                                ack="🤖 Fetching strategy status..."),
+    "/challenge_diag": _guarded(lambda: challengewatch.show_challenge_diag(), "🎯 [Diag] Error"),
+    "/bot_challenge":  _guarded(lambda: challengewatch.show_bot_challenge(),  "🤖 [Bot Challenge] Error"),
+    "/live_challenge": _guarded(lambda: challengewatch.show_live_challenge(), "🎯 [Live Challenge] Error"),
+    "/challenge":      _guarded(lambda: challengewatch.show_challenge(),      "🎯 [Challenge] Error"),   # legacy alias → LIVE
+    "/report":         _guarded(lambda: reportwatch.show_report(), "🤖 [Report] Error"),
+}
 
-    # ── /challenge (legacy alias) → defaults to LIVE challenge ───────────────
-    if text.startswith("/challenge"):
-        try:
-            challengewatch.show_challenge()
-        except Exception as e:
-            send_text(f"🎯 [Challenge] Error: {e}")
-        return
 
-    # ── /report ───────────────────────────────────────────────────────────────
-    if text.startswith("/report"):
-        try:
-            reportwatch.show_report()
-        except Exception as e:
-            send_text(f"🤖 [Report] Error: {e}")
-        return
+def _handle_command(text: str, text_raw: str, msg: dict | None = None):
+    # "/vix@MacroWatchBot args" → "/vix"
+    cmd = text.split(maxsplit=1)[0].split("@", 1)[0]
+    handler = COMMANDS.get(cmd)
+    if handler:
+        handler(text_raw, msg or {})
 
 
 # ─── Entrypoint ──────────────────────────────────────────────────────────────
@@ -1450,6 +1336,11 @@ if __name__ == "__main__":
     threading.Thread(target=command_loop, daemon=True).start()
     print("💬 Command loop started ✅", flush=True)
 
-    # Keep process alive
-    while True:
-        time.sleep(3600)
\ No newline at end of file
+    # Keep process alive until Render (SIGTERM) or Ctrl-C (SIGINT) stops it,
+    # then let running jobs finish instead of dying mid-send
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT,  lambda *_: stop.set())
+    stop.wait()
+    print("🛑 Shutting down scheduler...", flush=True)
+    SCHED.shutdown(wait=True)
\ No newline at end of file
@@ -15,6 +15,7 @@ Deliberately different from the daily brief:
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 
@@ -47,17 +48,18 @@ FINNHUB_SYMBOLS = {
 
 MODEL = os.getenv("CRYPTOWATCH_WEEKLY_MODEL", "gpt-4.1-mini")
 
+# Tickers, weekly ranges and the macro overlay are independent — fetch together
+_FETCH_POOL = ThreadPoolExecutor(max_workers=5, thread_name_prefix="cw_weekly")
+
 # ─── System prompt ────────────────────────────────────────────────────────────
 
 WEEKLY_SYSTEM_PROMPT = """You are CryptoWatch, a sharp desk strategist sending a Sunday evening weekly brief to ETH/BTC perp traders.
 
 HARD RULES:
-- 200-280 words MAX. Hard limit. Every word must earn its place.
-- Write in flowing prose, not bullet points. No headers with dashes, no sub-bullets.
-- Skip any macro point where data is missing — don't fill with "no data available" filler.
-- Never say you are an AI. Never add disclaimers.
-- If macro overlay is missing or sparse, skip the macro section entirely and keep it to crypto structure only.
-- Confident and direct. No hedging language like "suggests", "may", "could potentially".
+- 200-280 words MAX. Every word must earn its place.
+- Flowing prose: no bullet points, no dash headers, no sub-bullets.
+- Missing data: skip the point (or the whole Macro section) — no "no data available" filler.
+- Confident and direct. No hedging ("suggests", "may", "could potentially"). No AI mentions or disclaimers.
 
 OUTPUT FORMAT (strict — prose only, minimal headers):
 
@@ -69,14 +71,17 @@ OUTPUT FORMAT (strict — prose only, minimal headers):
 [2-3 sentences max. BTC weekly candle character, key level to watch, structure intact or breaking. ETH vs BTC in one clause. No separate ETH section.]
 
 🌍 Macro
-[2 sentences max. Only include if Finnhub macro overlay has real data. DXY + rates + SPX in one read. Skip entirely if no data.]
+[2 sentences max, only with real Finnhub overlay data. DXY + rates + SPX in one read.]
 
 ⚡ Next Week
-[2-3 sentences. Bias, what changes it, one specific thing to watch. No bullet points.]
-
-Total: under 280 words. If you exceed 280 words you have failed.
+[2-3 sentences. Bias, what changes it, one specific thing to watch.]
 """
 
+# Completion budget follows the prompt's word limit: ~1.6 tokens/word with
+# emojis and headers, plus ~60% headroom so the last section isn't cut off.
+BRIEF_MAX_WORDS = 280
+MAX_TOKENS      = int(BRIEF_MAX_WORDS * 1.6 * 1.6)
+
 # ─── Bitget helpers ───────────────────────────────────────────────────────────
 
 def _public_get(path: str, params: dict | None = None) -> dict | None:
@@ -110,6 +115,23 @@ def _parse_ticker(data: dict) -> dict | None:
     }
 
 
+_CANDLE_DTYPE = [("ts", "i8"), ("open", "f8"), ("high", "f8"),
+                 ("low", "f8"), ("close", "f8"), ("vol", "f8")]
+
+
+def _candles_to_array(data: list):
+    """Bitget candle rows [ts, o, h, l, c, vol, ...] → NumPy structured array."""
+    import numpy as np
+
+    rows = [
+        (int(r[0]), float(r[1]), float(r[2]), float(r[3]), float(r[4]),
+         float(r[5]) if len(r) > 5 else 0.0)
+        for r in data
+        if isinstance(r, (list, tuple)) and len(r) >= 5
+    ]
+    return np.array(rows, dtype=_CANDLE_DTYPE)
+
+
 def _fetch_weekly_range(symbol: str) -> dict | None:
     """Fetch 4H candles and derive 7-day OHLC range."""
     try:
@@ -121,22 +143,17 @@ def _fetch_weekly_range(symbol: str) -> dict | None:
         data = (raw or {}).get("data") or []
         if not data:
             return None
-        closes = []
-        highs  = []
-        lows   = []
-        for row in data:
-            if isinstance(row, (list, tuple)) and len(row) >= 5:
-                highs.append(float(row[2]))
-                lows.append(float(row[3]))
-                closes.append(float(row[4]))
-        if not closes:
+        candles = _candles_to_array(data)
+        if not candles.size:
             return None
+        closes = candles["close"]
+        first, last = float(closes[0]), float(closes[-1])
         return {
-            "open":  closes[0],
-            "close": closes[-1],
-            "high":  max(highs),
-            "low":   min(lows),
-            "change_pct": round((closes[-1] - closes[0]) / closes[0] * 100, 2) if closes[0] else None,
+            "open":  first,
+            "close": last,
+            "high":  float(candles["high"].max()),
+            "low":   float(candles["low"].min()),
+            "change_pct": round((last - first) / first * 100, 2) if first else None,
         }
     except Exception as e:
         log.warning(f"Weekly range fetch failed for {symbol}: {e}")
@@ -210,24 +227,27 @@ def _build_snapshot() -> dict:
         "meta":        {},
     }
 
+    ticker = "/api/v2/mix/market/ticker"
+    btc_fut       = _FETCH_POOL.submit(_public_get, ticker, {"productType": PRODUCT_TYPE, "symbol": BTC_SYMBOL})
+    eth_fut       = _FETCH_POOL.submit(_public_get, ticker, {"productType": PRODUCT_TYPE, "symbol": ETH_SYMBOL})
+    btc_range_fut = _FETCH_POOL.submit(_fetch_weekly_range, BTC_SYMBOL)
+    eth_range_fut = _FETCH_POOL.submit(_fetch_weekly_range, ETH_SYMBOL)
+    overlay_fut   = _FETCH_POOL.submit(fetch_macro_overlay)
+
     # Current ticker
-    btc_raw = _public_get("/api/v2/mix/market/ticker",
-                          {"productType": PRODUCT_TYPE, "symbol": BTC_SYMBOL})
-    btc = _parse_ticker(btc_raw)
+    btc = _parse_ticker(btc_fut.result())
     if btc:
         btc["symbol"] = BTC_SYMBOL
         snapshot["btc"] = btc
 
-    eth_raw = _public_get("/api/v2/mix/market/ticker",
-                          {"productType": PRODUCT_TYPE, "symbol": ETH_SYMBOL})
-    eth = _parse_ticker(eth_raw)
+    eth = _parse_ticker(eth_fut.result())
     if eth:
         eth["symbol"] = ETH_SYMBOL
         snapshot["eth"] = eth
 
     # 7-day OHLC range from 4H candles
-    btc_range = _fetch_weekly_range(BTC_SYMBOL)
-    eth_range = _fetch_weekly_range(ETH_SYMBOL)
+    btc_range = btc_range_fut.result()
+    eth_range = eth_range_fut.result()
     if btc_range:
         snapshot["weekly_range"]["btc"] = btc_range
     if eth_range:
@@ -235,7 +255,7 @@ def _build_snapshot() -> dict:
 
     # Macro overlay
     try:
-        overlay = fetch_macro_overlay()
+        overlay = overlay_fut.result()
         if overlay.get("items"):
             snapshot["meta"]["macro_overlay"] = overlay
     except Exception as e:
@@ -257,16 +277,23 @@ def _generate_brief(snapshot: dict) -> str:
     )
 
     try:
-        resp = client.chat.completions.create(
+        # Streamed: the weekly brief is the longest completion in the bot, so
+        # collect deltas as they arrive instead of holding one response body
+        stream = client.chat.completions.create(
             model=MODEL,
             temperature=0.65,   # slightly lower than daily for more consistent strategic tone
-            max_tokens=1100,
+            max_tokens=MAX_TOKENS,
+            stream=True,
             messages=[
                 {"role": "system", "content": WEEKLY_SYSTEM_PROMPT},
                 {"role": "user",   "content": "Generate the WEEKLY strategic brief:\n\n" + payload},
             ],
         )
-        return resp.choices[0].message.content.strip()
+        parts = [chunk.choices[0].delta.content or "" for chunk in stream if chunk.choices]
+        brief = "".join(parts).strip()
+        if not brief:
+            raise RuntimeError("empty completion")
+        return brief
     except Exception as e:
         log.exception(f"OpenAI call failed: {e}")
         return (
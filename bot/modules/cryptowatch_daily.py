@@ -1,20 +1,47 @@
 import logging
 import os
+import re
 import json
+import atexit
+import functools
+import random
+import time
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from pathlib import Path
 from zoneinfo import ZoneInfo
 
 import requests
-from openai import OpenAI
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson   # faster, parses bytes directly, compact output by default
+    _json_loads = orjson.loads
+
+    def _json_dumps_compact(obj: dict) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps_compact(obj: dict) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
 
 from bot.utils import send_text
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s: %(message)s")
 log = logging.getLogger("cryptowatch_daily")
 
-client = OpenAI()
 BRUSSELS_TZ = ZoneInfo("Europe/Brussels")
 
+# ======================
+# Brief config (read once at import, like the rest of the env settings)
+# ======================
+
+ENABLED = os.getenv("ENABLE_CRYPTOWATCH_DAILY", "true").lower() in ("1", "true", "yes", "on")
+MODEL   = os.getenv("CRYPTOWATCH_DAILY_MODEL", "gpt-4o-mini")
+
 # ======================
 # Bitget config (public futures endpoints)
 # ======================
@@ -25,6 +52,54 @@ BTC_SYMBOL = "BTCUSDT"
 ETH_SYMBOL = "ETHUSDT"
 PRODUCT_TYPE = os.getenv("BITGET_PRODUCT_TYPE", "USDT-FUTURES")  # allow env override
 
+# Static per-process: built once instead of on every snapshot
+_TICKER_PATH = "/api/v2/mix/market/ticker"
+_BTC_PARAMS  = {"productType": PRODUCT_TYPE, "symbol": BTC_SYMBOL}
+_ETH_PARAMS  = {"productType": PRODUCT_TYPE, "symbol": ETH_SYMBOL}
+
+# The per-brief fetches are independent and network-bound: run them on a
+# small shared pool so wall time is ~max(RTT) instead of sum(RTT).
+_FETCH_POOL = ThreadPoolExecutor(max_workers=5, thread_name_prefix="cw_daily")
+# Separate pool for the Finnhub quotes: fetch_macro_overlay itself runs on
+# _FETCH_POOL, and waiting on nested tasks in the same pool can deadlock.
+_QUOTE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cw_quote")
+
+# A transient 503 / timeout used to drop the whole field for the day.
+# The session's adapters retry GETs on connection errors, timeouts, 429 and
+# 5xx with exponential backoff; callers keep their own try/except so the
+# final fallback is still None.
+RETRY_ATTEMPTS      = 3
+RETRY_BACKOFF_SEC   = 0.3
+RETRY_AFTER_CAP_SEC = 10.0
+RETRY_STATUSES      = (429, 500, 502, 503, 504)
+
+
+class _CappedRetry(Retry):
+    """Honours Retry-After, capped so a brief never stalls for minutes."""
+
+    def get_retry_after(self, response):
+        after = super().get_retry_after(response)
+        return None if after is None else min(after, RETRY_AFTER_CAP_SEC)
+
+
+_RETRY = _CappedRetry(
+    total=RETRY_ATTEMPTS - 1,
+    backoff_factor=RETRY_BACKOFF_SEC,
+    status_forcelist=RETRY_STATUSES,
+    allowed_methods=("GET",),
+    raise_on_status=False,   # hand the last 5xx back so callers log it as before
+)
+
+# One keep-alive session for every fetch in this module: repeat calls to the
+# same host (two Bitget tickers, four Finnhub quotes, retries) reuse the
+# TCP+TLS connection instead of a fresh handshake per requests.get().
+# One pool per host: Bitget, alternative.me, Finnhub, FedWatch.
+_HTTP = requests.Session()
+_HTTP.headers.update({"User-Agent": "MacroWatch/1.0"})
+_HTTP.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=_RETRY))
+_HTTP.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=_RETRY))
+atexit.register(_HTTP.close)
+
 # ======================
 # Optional macro / FedWatch integration
 # ======================
@@ -53,28 +128,104 @@ FINNHUB_SYMBOLS = {
 # OpenAI prompt
 # ======================
 
-DAILY_SYSTEM_PROMPT = """You are CryptoWatch — a degen crypto trader sending a morning pulse to the group before the US open.
-
-HARD RULES:
-- 80-120 words MAX. Punchy. No fluff.
-- Degen tone — confident, direct, a bit edgy. Like a trader who's seen it all.
-- Use emojis naturally — not every sentence, just where they add punch.
-- No headers, no bullet points, no labels. Flowing prose only.
-- Only use prices from the live snapshot. Never invent numbers.
-- Skip macro if no clear signal — don't fill with noise.
-- Fear & Greed only if extreme (<20 or >80).
-- No entries, stops, TPs. No AI disclaimer.
-- If market is boring, say it's boring. If it's spicy, make it feel spicy.
+DAILY_SYSTEM_PROMPT = """You are CryptoWatch: a degen crypto trader sending the group a morning pulse before the US open.
 
-OUTPUT FORMAT:
-One header line, then 3-5 sentences. Raw and real.
+Rules:
+- Header line + 3-5 sentences, 80-120 words. Flowing prose: no bullets, labels or sub-headers.
+- Confident, direct, a bit edgy. Emojis only where they add punch.
+- Numbers only from the snapshot; never invent. Boring market? Say so.
+- Macro only on a clear signal. Fear & Greed only if <20 or >80.
+- No entries/stops/TPs. No AI disclaimer.
 
-Example style:
+Example:
 📊 CryptoWatch — Mar 30
 
 BTC glued to $67K, ETH waking up at +3.1% 🔥 Fear & Greed sitting at 8 — full panic mode but price refuses to dump. Funding negative across the board, shorts are piling in. That's a squeeze waiting to happen. 👀 Watching $65K — lose that and it gets ugly fast.
 """
 
+# Built once: the system message is identical on every call
+_SYSTEM_MESSAGE = {"role": "system", "content": DAILY_SYSTEM_PROMPT}
+
+# Completion budget follows the prompt's word limit: ~1.6 tokens/word with
+# emojis, plus ~60% headroom so the last sentence isn't cut mid-way.
+BRIEF_MAX_WORDS = 120
+MAX_TOKENS      = int(BRIEF_MAX_WORDS * 1.6 * 1.6)
+
+# Static briefs: sent without calling the model
+_BRIEF_HEADER = "🧠 [CryptoWatch] Daily Macro Brief\n"
+
+FALLBACK_BRIEF = (
+    _BRIEF_HEADER
+    + "⚠️ Could not generate full daily analysis today (model error).\n"
+    "Manage risk defensively."
+)
+DATA_LIMITED_BRIEF = (
+    _BRIEF_HEADER
+    + "⚠️ Market data limited today (Bitget tickers unavailable).\n"
+    "Manage risk defensively."
+)
+SNAPSHOT_ERROR_BRIEF = _BRIEF_HEADER + "⚠️ Could not build market snapshot from Bitget."
+
+# ======================
+# Brief cache (disk)
+# ======================
+# Scheduler retries / Render restarts inside the pre-open window used to pay
+# for a second full OpenAI call. Cache the generated brief per (date, model)
+# for a few hours. Live prices tick on every run, so hashing the snapshot
+# would never hit — the date is the meaningful key for a once-a-day brief.
+
+BRIEF_CACHE_PATH  = Path(os.getenv("CW_CACHE_DIR", "/tmp")) / "cw_daily.json"
+BRIEF_CACHE_TTL_S = float(os.getenv("CW_CACHE_TTL_H", "6")) * 3600
+
+
+def _load_cached_brief(key: str) -> str | None:
+    try:
+        if time.time() - BRIEF_CACHE_PATH.stat().st_mtime > BRIEF_CACHE_TTL_S:
+            return None
+        cached = json.loads(BRIEF_CACHE_PATH.read_text(encoding="utf-8"))
+        return cached.get("brief") if cached.get("key") == key else None
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json_atomic(path: Path, obj: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(obj, f, ensure_ascii=False)
+    os.replace(tmp, path)   # atomic: readers never see a partial file
+
+
+def _store_cached_brief(key: str, brief: str) -> None:
+    try:
+        _write_json_atomic(BRIEF_CACHE_PATH, {"key": key, "brief": brief})
+    except OSError as e:
+        log.warning("brief cache write failed: %s", e)
+
+# ======================
+# Daily token budget
+# ======================
+# Guard against a scheduler bug firing the brief in a loop: once today's
+# OpenAI usage passes the cap, serve the static fallback instead.
+
+USAGE_PATH      = Path(os.getenv("CW_USAGE_FILE", "/tmp/cw_usage.json"))
+DAILY_TOKEN_CAP = int(os.getenv("CW_DAILY_TOKEN_CAP", "20000"))
+
+
+def _tokens_used(date_str: str) -> int:
+    try:
+        usage = json.loads(USAGE_PATH.read_text(encoding="utf-8"))
+        return int(usage.get("tokens", 0)) if usage.get("date") == date_str else 0
+    except (OSError, ValueError):
+        return 0
+
+
+def _record_tokens(date_str: str, tokens: int) -> None:
+    try:
+        _write_json_atomic(USAGE_PATH, {"date": date_str, "tokens": _tokens_used(date_str) + tokens})
+    except OSError as e:
+        log.warning("token usage write failed: %s", e)
+
 # ======================
 # Bitget helpers (V2 futures)
 # ======================
@@ -82,11 +233,11 @@ BTC glued to $67K, ETH waking up at +3.1% 🔥 Fear & Greed sitting at 8 — ful
 def _public_get(path: str, params: dict | None = None) -> dict | None:
     try:
         url = f"{BITGET_BASE_URL}{path}"
-        resp = requests.get(url, params=params or {}, timeout=5)
+        resp = _HTTP.get(url, params=params or {}, timeout=5)
         if resp.status_code != 200:
             log.warning("Bitget HTTP %s: %s", resp.status_code, resp.text)
             return None
-        data = resp.json()
+        data = _json_loads(resp.content)
         if data.get("code") != "00000":
             log.warning("Bitget API error %s: %s", data.get("code"), data.get("msg"))
             return None
@@ -96,6 +247,18 @@ def _public_get(path: str, params: dict | None = None) -> dict | None:
         return None
 
 
+# (snapshot key, Bitget ticker field)
+_TICKER_FIELDS = (
+    ("last",        "lastPr"),
+    ("high24h",     "high24h"),
+    ("low24h",      "low24h"),
+    ("change24h",   "change24h"),
+    ("fundingRate", "fundingRate"),
+    ("indexPrice",  "indexPrice"),
+    ("markPrice",   "markPrice"),
+)
+
+
 def _parse_mix_ticker(data: dict) -> dict | None:
     if not data:
         return None
@@ -104,24 +267,18 @@ def _parse_mix_ticker(data: dict) -> dict | None:
         return None
     tick = items[0]
 
-    def _f(key):
-        v = tick.get(key)
-        if v is None or v == "":
-            return None
+    # Missing fields are left out rather than sent as null: fewer input
+    # tokens, and nothing for the model to speculate about
+    out = {}
+    for key, field in _TICKER_FIELDS:
+        v = tick.get(field)
+        if v in (None, ""):
+            continue
         try:
-            return float(v)
-        except Exception:
-            return None
-
-    return {
-        "last": _f("lastPr"),
-        "high24h": _f("high24h"),
-        "low24h": _f("low24h"),
-        "change24h": _f("change24h"),
-        "fundingRate": _f("fundingRate"),
-        "indexPrice": _f("indexPrice"),
-        "markPrice": _f("markPrice"),
-    }
+            out[key] = float(v)
+        except (TypeError, ValueError):
+            pass
+    return out
 
 # ======================
 # Stooq macro overlay helpers
@@ -132,14 +289,14 @@ def _finnhub_quote(symbol: str) -> dict | None:
     if not FINNHUB_KEY:
         return None
     try:
-        r = requests.get(
+        r = _HTTP.get(
             f"{FINNHUB_BASE}/quote",
             params={"symbol": symbol, "token": FINNHUB_KEY},
             timeout=6,
         )
         if r.status_code != 200:
             return None
-        data = r.json()
+        data = _json_loads(r.content)
         # c = current, pc = previous close, dp = change percent
         if not data.get("c"):
             return None
@@ -172,67 +329,104 @@ def _macro_point_finnhub(name: str, symbol: str) -> dict | None:
 def fetch_macro_overlay() -> dict:
     """Returns macro overlay dict using Finnhub."""
     overlay = {"source": "finnhub", "as_of_utc": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")}
-    items   = []
-
-    for name, sym in [
-        ("US10Y", FINNHUB_SYMBOLS["US10Y"]),
-        ("DXY",   FINNHUB_SYMBOLS["DXY"]),
-        ("S&P 500", FINNHUB_SYMBOLS["SPX"]),
-        ("Gold",  FINNHUB_SYMBOLS["Gold"]),
-    ]:
-        pt = _macro_point_finnhub(name, sym)
-        if pt:
-            items.append(pt)
-
-    overlay["items"] = items
+    names   = ("US10Y", "DXY", "S&P 500", "Gold")
+    symbols = (FINNHUB_SYMBOLS["US10Y"], FINNHUB_SYMBOLS["DXY"], FINNHUB_SYMBOLS["SPX"], FINNHUB_SYMBOLS["Gold"])
+
+    # The four quotes are independent; map keeps the output order stable
+    points = _QUOTE_POOL.map(_macro_point_finnhub, names, symbols)
+    overlay["items"] = [pt for pt in points if pt]
     return overlay
 
 # ======================
 # Snapshot builder
 # ======================
 
-def fetch_basic_market_snapshot() -> dict:
+# Burst invocations (retry, manual kick) within a minute reuse the last
+# parsed tickers instead of hitting Bitget again. Only full fetches are kept.
+SNAPSHOT_TTL_SEC = 60
+# "ts" is monotonic (for the TTL); "at" is the wall-clock fetch time, so a
+# cached snapshot reports when its prices were actually taken.
+_SNAPSHOT_CACHE: dict = {"ts": 0.0, "at": None, "btc": None, "eth": None}
+
+
+def _fetch_tickers() -> tuple[dict | None, dict | None, datetime | None]:
+    """BTC/ETH tickers, plus the original fetch time when served from cache (else None)."""
+    if _SNAPSHOT_CACHE["btc"] and time.monotonic() - _SNAPSHOT_CACHE["ts"] < SNAPSHOT_TTL_SEC:
+        return dict(_SNAPSHOT_CACHE["btc"]), dict(_SNAPSHOT_CACHE["eth"]), _SNAPSHOT_CACHE["at"]
+
+    btc_fut = _FETCH_POOL.submit(_public_get, _TICKER_PATH, _BTC_PARAMS)
+    eth_fut = _FETCH_POOL.submit(_public_get, _TICKER_PATH, _ETH_PARAMS)
+
+    btc = _parse_mix_ticker(btc_fut.result())
+    if btc:
+        btc["symbol"] = BTC_SYMBOL
+    eth = _parse_mix_ticker(eth_fut.result())
+    if eth:
+        eth["symbol"] = ETH_SYMBOL
+
+    if btc and eth:
+        _SNAPSHOT_CACHE.update(ts=time.monotonic(), at=datetime.now(timezone.utc),
+                               btc=dict(btc), eth=dict(eth))
+    else:
+        _SNAPSHOT_CACHE.update(ts=0.0, at=None, btc=None, eth=None)
+    return btc, eth, None
+
+
+def fetch_basic_market_snapshot(now: datetime | None = None) -> dict:
+    now = now or datetime.now(timezone.utc)
     snapshot: dict = {
-        "as_of_utc": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+        "as_of_utc": now.strftime("%Y-%m-%d %H:%M:%S"),
         "btc": {},
         "eth": {},
         "meta": {},
     }
 
-    btc_raw = _public_get("/api/v2/mix/market/ticker", {"productType": PRODUCT_TYPE, "symbol": BTC_SYMBOL})
-    btc = _parse_mix_ticker(btc_raw)
+    btc, eth, cached_at = _fetch_tickers()
+    if cached_at:
+        # Don't claim cached prices are fresher than they are
+        snapshot["as_of_utc"] = cached_at.strftime("%Y-%m-%d %H:%M:%S")
+        snapshot["meta"]["tickers_cached"] = True
     if btc:
-        btc["symbol"] = BTC_SYMBOL
         snapshot["btc"] = btc
-
-    eth_raw = _public_get("/api/v2/mix/market/ticker", {"productType": PRODUCT_TYPE, "symbol": ETH_SYMBOL})
-    eth = _parse_mix_ticker(eth_raw)
     if eth:
-        eth["symbol"] = ETH_SYMBOL
         snapshot["eth"] = eth
 
     snapshot["meta"]["notes"] = "BTC/ETH USDT perpetual futures data from Bitget V2 (ticker)."
-    snapshot["meta"]["macro_context"] = None
-    snapshot["meta"]["macro_overlay"] = None
     return snapshot
 
 # ======================
 # Macro / FedWatch helpers
 # ======================
 
+# FedWatch text is written for Telegram (markdown, bullets, blank lines);
+# none of that helps the model, and it all costs input tokens.
+MACRO_CONTEXT_MAX_CHARS = 2000
+_MD_BULLET_RE = re.compile(r"^[ \t]*(?:[-•]|>+)[ \t]+", re.M)   # bullets, blockquotes
+_MD_MARKUP_RE = re.compile(r"[*_#`]+")
+_HSPACE_RE    = re.compile(r"[ \t]+")
+_NEWLINES_RE  = re.compile(r"\s*\n\s*")   # blank lines + edge spaces
+
+
+def _compact_macro_text(text: str) -> str:
+    text = _MD_BULLET_RE.sub("", text)
+    text = _MD_MARKUP_RE.sub("", text)
+    text = _HSPACE_RE.sub(" ", text)
+    return _NEWLINES_RE.sub("\n", text).strip()
+
+
 def fetch_macro_context() -> str | None:
     if not FEDWATCH_DAILY_URL:
         return None
     try:
-        resp = requests.get(FEDWATCH_DAILY_URL, timeout=5)
+        resp = _HTTP.get(FEDWATCH_DAILY_URL, timeout=5)
         if resp.status_code != 200:
             log.warning("FedWatch HTTP %s: %s", resp.status_code, resp.text)
             return None
-        text = (resp.text or "").strip()
+        text = _compact_macro_text(resp.text or "")
         if not text:
             return None
-        if len(text) > 4000:
-            text = text[:4000] + "\n\n[macro_context truncated]"
+        if len(text) > MACRO_CONTEXT_MAX_CHARS:
+            text = text[:MACRO_CONTEXT_MAX_CHARS] + " [truncated]"
         return text
     except Exception as e:
         log.warning("FedWatch request failed: %s", e)
@@ -242,34 +436,162 @@ def fetch_macro_context() -> str | None:
 # OpenAI call
 # ======================
 
-def _build_user_payload(snapshot: dict) -> str:
-    date_str = datetime.now(BRUSSELS_TZ).strftime("%Y-%m-%d")
+def _build_user_payload(snapshot: dict, date_str: str) -> str:
     payload = {"date": date_str, "snapshot": snapshot}
-    return json.dumps(payload, ensure_ascii=False)
+    # No spaces after "," / ":" — they're billed as input tokens
+    return _json_dumps_compact(payload)
+
+
+# Routes every daily call to the same prompt-cache shard; bump the suffix
+# whenever DAILY_SYSTEM_PROMPT changes so stale prefixes aren't targeted.
+PROMPT_CACHE_KEY = "cryptowatch_daily_v1"
+
+OPENAI_RETRY_ATTEMPTS = 3
+OPENAI_RETRY_MIN_SEC  = 0.3
+OPENAI_RETRY_MAX_SEC  = 2.5   # 2 waits max → worst case ~5s, inside the Telegram send window
+
+
+# openai (httpx, pydantic, ...) is imported on first use rather than at module
+# load, so a disabled brief or a snapshot-only run doesn't pay for it.
+@functools.cache
+def _client():
+    from openai import OpenAI
+    return OpenAI(max_retries=0)   # retries handled by _call_openai (bounded, jittered)
+
 
+@functools.cache
+def _openai_retryable() -> tuple:
+    from openai import APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+    return (RateLimitError, APIConnectionError, APITimeoutError, InternalServerError)
 
-def generate_daily_brief(snapshot: dict) -> str:
-    payload_str = _build_user_payload(snapshot)
-    model_name = os.getenv("CRYPTOWATCH_DAILY_MODEL", "gpt-4.1-mini")
 
+def _call_openai(**kwargs):
+    """chat.completions.create with jittered exponential backoff on 429 / 5xx / connection errors."""
+    retryable = _openai_retryable()
+    for attempt in range(1, OPENAI_RETRY_ATTEMPTS + 1):
+        try:
+            return _client().chat.completions.create(**kwargs)
+        except retryable as e:
+            if attempt == OPENAI_RETRY_ATTEMPTS:
+                raise
+            cap   = min(OPENAI_RETRY_MAX_SEC, OPENAI_RETRY_MIN_SEC * 2 ** attempt)
+            delay = random.uniform(OPENAI_RETRY_MIN_SEC, cap)
+            log.warning("OpenAI %s, retry %d/%d in %.1fs", type(e).__name__, attempt, OPENAI_RETRY_ATTEMPTS - 1, delay)
+            time.sleep(delay)
+
+
+# Flex processing: ~50% cheaper tokens in exchange for slower, best-effort
+# capacity. The daily brief isn't latency-critical to the second, so allow
+# opting in; any flex failure falls back to the normal tier.
+USE_FLEX         = os.getenv("CW_USE_FLEX", "false").lower() in ("1", "true", "yes", "on")
+FLEX_TIMEOUT_SEC = float(os.getenv("CW_FLEX_TIMEOUT_SEC", "120"))
+
+
+def _consume_stream(stream) -> tuple[str, object]:
+    """Join a streamed completion's deltas; returns (text, usage or None)."""
+    parts = []
+    usage = None
+    for chunk in stream:
+        if chunk.choices:
+            parts.append(chunk.choices[0].delta.content or "")
+        if chunk.usage:
+            usage = chunk.usage
+    return "".join(parts).strip(), usage
+
+
+def _call_openai_flex(**kwargs) -> tuple[str, object]:
+    """Streamed completion on the flex tier; returns (text, usage) like _consume_stream.
+
+    One flex attempt, no retries: a 429 there means no flex capacity, and
+    retrying 120s timeouts could stall the brief for minutes. The stream is
+    consumed here because with stream=True create() returns at the headers, so
+    timeouts and server errors surface mid-iteration. Any failure (or an empty
+    reply) goes straight to the standard tier, which has its own bounded retries.
+    """
+    flex_body = {**kwargs.get("extra_body", {}), "service_tier": "flex"}
     try:
-        resp = client.chat.completions.create(
-            model=model_name,
+        stream = _client().chat.completions.create(
+            **{**kwargs, "extra_body": flex_body}, timeout=FLEX_TIMEOUT_SEC,
+        )
+        text, usage = _consume_stream(stream)
+        if not text:
+            raise RuntimeError("empty completion")
+        return text, usage
+    except Exception as e:
+        log.warning("Flex tier failed (%s), falling back to default tier", type(e).__name__)
+        return _consume_stream(_call_openai(**kwargs))
+
+
+# OpenAI only caches prompts of at least this many tokens
+PROMPT_CACHE_MIN_TOKENS = 1024
+
+
+def _log_usage(usage) -> None:
+    """Log token usage; cached_tokens shows whether the static prefix hit OpenAI's prompt cache."""
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached  = getattr(details, "cached_tokens", 0) or 0
+    log.info(
+        "cryptowatch_daily tokens prompt=%d cached=%d (%.0f%%) completion=%d",
+        usage.prompt_tokens, cached, 100 * cached / max(usage.prompt_tokens, 1), usage.completion_tokens,
+    )
+    # A cacheable prompt with zero hits usually means the prefix drifted
+    # (prompt edited, something dynamic crept into the system message)
+    if usage.prompt_tokens >= PROMPT_CACHE_MIN_TOKENS and not cached:
+        log.warning(
+            "cryptowatch_daily prompt cache miss on a %d-token prompt — check that "
+            "DAILY_SYSTEM_PROMPT is static and PROMPT_CACHE_KEY (%s) is current",
+            usage.prompt_tokens, PROMPT_CACHE_KEY,
+        )
+
+
+def generate_daily_brief(snapshot: dict, now: datetime | None = None) -> str:
+    # Same instant as the snapshot's as_of_utc, so the two can't straddle midnight
+    now = now or datetime.now(timezone.utc)
+    date_str  = now.astimezone(BRUSSELS_TZ).strftime("%Y-%m-%d")
+    cache_key = f"{date_str}|{MODEL}"
+    cached = _load_cached_brief(cache_key)
+    if cached:
+        log.info("Daily brief served from cache (%s)", cache_key)
+        return cached
+
+    used = _tokens_used(date_str)
+    if used >= DAILY_TOKEN_CAP:
+        log.warning("Daily token cap reached (%d/%d), sending static brief", used, DAILY_TOKEN_CAP)
+        return FALLBACK_BRIEF
+
+    payload_str = _build_user_payload(snapshot, date_str)
+
+    try:
+        # Streamed so decoding overlaps the network instead of waiting for
+        # one final response body.
+        request = dict(
+            model=MODEL,
             temperature=0.7,
-            max_tokens=900,
+            max_tokens=MAX_TOKENS,
+            stream=True,
+            stream_options={"include_usage": True},
+            extra_body={"prompt_cache_key": PROMPT_CACHE_KEY},
+            # Static system prompt first, per-day data last: keeps the prefix
+            # byte-identical so OpenAI's automatic prompt caching can apply.
             messages=[
-                {"role": "system", "content": DAILY_SYSTEM_PROMPT},
-                {"role": "user", "content": "Generate the DAILY brief (no trade plan, no entries/stops/TPs):\n\n" + payload_str},
+                _SYSTEM_MESSAGE,
+                {"role": "user", "content": "Snapshot:\n" + payload_str},
             ],
         )
-        return resp.choices[0].message.content.strip()
+        if USE_FLEX:
+            brief, usage = _call_openai_flex(**request)
+        else:
+            brief, usage = _consume_stream(_call_openai(**request))
+        if not brief:
+            raise RuntimeError("empty completion")
+        if usage:
+            _log_usage(usage)
+            _record_tokens(date_str, usage.total_tokens)
+        _store_cached_brief(cache_key, brief)
+        return brief
     except Exception as e:
         log.exception("OpenAI call failed: %s", e)
-        return (
-            "🧠 [CryptoWatch] Daily Macro Brief\n"
-            "⚠️ Could not generate full daily analysis today (model error).\n"
-            "Manage risk defensively."
-        )
+        return FALLBACK_BRIEF
 
 # ======================
 # Entry point
@@ -281,11 +603,11 @@ def fetch_fear_greed() -> dict | None:
     Returns {"value": 34, "label": "Fear", "updated": "..."} or None.
     """
     try:
-        r = requests.get(
-            "https://api.alternative.me/fng/?limit=1",
-            timeout=5,
-        )
-        data = r.json().get("data", [{}])[0]
+        r = _HTTP.get("https://api.alternative.me/fng/?limit=1", timeout=5)
+        if r.status_code != 200:
+            log.warning("Fear & Greed HTTP %s", r.status_code)
+            return None
+        data = _json_loads(r.content).get("data", [{}])[0]
         return {
             "value": int(data.get("value", 0)),
             "label": data.get("value_classification", ""),
@@ -297,22 +619,40 @@ def fetch_fear_greed() -> dict | None:
 
 
 def main():
+    if not ENABLED:
+        log.info("CryptoWatch daily disabled via env.")
+        return
+
+    # None of the optional sources depend on Bitget — start them alongside
+    # the tickers so the whole snapshot costs ~max(RTT) instead of sum(RTT)
+    fg_fut      = _FETCH_POOL.submit(fetch_fear_greed)
+    macro_fut   = _FETCH_POOL.submit(fetch_macro_context)
+    overlay_fut = _FETCH_POOL.submit(fetch_macro_overlay)
+
+    now_utc = datetime.now(timezone.utc)
     try:
-        snapshot = fetch_basic_market_snapshot()
+        snapshot = fetch_basic_market_snapshot(now=now_utc)
     except Exception as e:
         log.exception("error building snapshot: %s", e)
-        send_text("🧠 [CryptoWatch] Daily Macro Brief\n⚠️ Could not build market snapshot from Bitget.")
+        send_text(SNAPSHOT_ERROR_BRIEF)
+        return
+
+    # Both tickers down: the model would only produce a generic brief, so
+    # skip the round-trip (and its tokens) and say so directly.
+    if not snapshot["btc"] and not snapshot["eth"]:
+        log.warning("Empty Bitget snapshot, sending static brief")
+        send_text(DATA_LIMITED_BRIEF)
         return
 
     # Macro context from FedWatch (optional)
-    macro_text = fetch_macro_context()
+    macro_text = macro_fut.result()
     if macro_text:
         snapshot.setdefault("meta", {})
         snapshot["meta"]["macro_context"] = macro_text
 
     # Macro overlay from Stooq (optional but preferred)
     try:
-        overlay = fetch_macro_overlay()
+        overlay = overlay_fut.result()
         if overlay.get("items"):
             snapshot.setdefault("meta", {})
             snapshot["meta"]["macro_overlay"] = overlay
@@ -321,12 +661,12 @@ def main():
 
     # Fear & Greed index
     try:
-        fg = fetch_fear_greed()
+        fg = fg_fut.result()
         if fg:
             snapshot.setdefault("meta", {})
             snapshot["meta"]["fear_greed"] = fg
     except Exception as e:
         log.warning("fear & greed fetch failed: %s", e)
 
-    brief = generate_daily_brief(snapshot)
+    brief = generate_daily_brief(snapshot, now=now_utc)
     send_text(brief)
\ No newline at end of file
@@ -12,18 +12,56 @@ otherwise falls back to a structured card.
 """
 
 import os
+import re
+import time
 import logging
 import requests
 from datetime import datetime, timezone, timedelta
 
 from bot.utils import send_text
 
+try:
+    from orjson import loads as _json_loads   # faster C parser, stdlib fallback below
+except ImportError:
+    from json import loads as _json_loads
+
 log = logging.getLogger("dailybrief")
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 OPENAI_MODEL   = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 BRUSSELS_TZ    = "Europe/Brussels"
 
+# Static instructions for the evening AI summary. Kept byte-identical across
+# calls (only the context varies, in the user message) so OpenAI's automatic
+# prompt caching can reuse the prefix.
+_AI_SUMMARY_SYSTEM = (
+    "Write a 2-sentence plain-English summary of today's crypto market "
+    "for a private investor group, under 60 words. No jargon. No hype. Factual only. "
+    "Context is one line of key=value pairs: btc/eth = price (24h %), "
+    "regime = market regime, fnd = BTC funding, trump = TrumpWatch alerts today, "
+    "fed = Fed events today, move = notable BTC 24h move (- if none). "
+    'Reply as JSON: {"summary": "..."}'
+)
+
+# Compact shorthand for the AI context line (keys documented in the prompt above)
+_AI_CONTEXT_FMT = "btc={btc}|eth={eth}|regime={regime}|fnd={fnd}|trump={trump}|fed={fed}|move={move}"
+
+# Structured output: a single string field. Strict mode rejects length keywords
+# like maxLength, so length is bounded by the prompt (60 words) and max_tokens.
+_AI_SUMMARY_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name":   "evening_summary",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {"summary": {"type": "string"}},
+            "required": ["summary"],
+            "additionalProperties": False,
+        },
+    },
+}
+
 # Track today's alert counts (reset at midnight UTC)
 _daily_state: dict = {
     "date":           None,   # YYYY-MM-DD
@@ -34,8 +72,20 @@ _daily_state: dict = {
 }
 
 
+# Today's UTC date string, recomputed only once the next UTC midnight passes
+_TODAY_CACHE: dict = {"iso": None, "until": 0.0}
+
+
+def _today_iso() -> str:
+    now_ts = time.time()
+    if now_ts >= _TODAY_CACHE["until"]:
+        _TODAY_CACHE["iso"]   = time.strftime("%Y-%m-%d", time.gmtime(now_ts))
+        _TODAY_CACHE["until"] = (now_ts // 86400 + 1) * 86400
+    return _TODAY_CACHE["iso"]
+
+
 def _reset_if_new_day():
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    today = _today_iso()
     if _daily_state["date"] != today:
         _daily_state.update({
             "date":           today,
@@ -59,6 +109,19 @@ def record_fedwatch_event(title: str):
         _daily_state["fedwatch_fired"].append(title)
 
 
+def _to_metric(v) -> float | None:
+    """
+    Normalize a raw API field once: float, or None if missing/unparseable.
+    Everything downstream then only has to test `is None`.
+    """
+    if v is None or v == "":
+        return None
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return None
+
+
 def _fetch_price(symbol: str) -> float | None:
     try:
         r = requests.get(
@@ -69,7 +132,7 @@ def _fetch_price(symbol: str) -> float | None:
         data = r.json().get("data") or {}
         if isinstance(data, list):
             data = data[0] if data else {}
-        return float(data.get("lastPr") or data.get("close") or 0) or None
+        return _to_metric(data.get("lastPr") or data.get("close")) or None   # 0 is not a price
     except Exception as e:
         log.warning(f"price fetch failed for {symbol}: {e}")
         return None
@@ -85,11 +148,28 @@ def _fetch_funding(symbol: str) -> float | None:
         data = r.json().get("data") or {}
         if isinstance(data, list):
             data = data[0] if data else {}
-        return float(data.get("fundingRate") or 0) or None
+        return _to_metric(data.get("fundingRate"))
     except Exception:
         return None
 
 
+def _derive_display(btc: float | None, eth: float | None,
+                    funding_btc: float | None,
+                    btc_chg: float | None = None,
+                    eth_chg: float | None = None) -> dict:
+    """
+    Format raw metrics into display strings once.
+    Both the cards and the AI context read from this, so they can't drift.
+    """
+    btc_chg_s = f" ({btc_chg:+.2f}%)" if btc_chg is not None else ""
+    eth_chg_s = f" ({eth_chg:+.2f}%)" if eth_chg is not None else ""
+    return {
+        "btc_str":     f"${btc:,.0f}{btc_chg_s}" if btc is not None else "N/A",
+        "eth_str":     f"${eth:,.2f}{eth_chg_s}" if eth is not None else "N/A",
+        "funding_str": f"{funding_btc*100:.4f}%/8h" if funding_btc is not None else "N/A",
+    }
+
+
 def _regime_label(modules: dict) -> str:
     """Quick regime from CorrelWatch / price context — BULL / BEAR / CHOP."""
     try:
@@ -125,13 +205,12 @@ def _events_today(modules: dict) -> list:
     """High-impact events firing TODAY (UTC)."""
     try:
         HIGH   = {"FOMC", "CPI", "NFP", "ECB", "PPI"}
-        events = modules["fedwatch"].STATE.get("events", [])
         now    = datetime.now(timezone.utc)
         today  = now.date()
+        events = modules["fedwatch"].events_between(now - timedelta(days=1), now + timedelta(days=1))
         return [
             ev for ev in events
             if ev.get("category") in HIGH
-            and ev.get("start")
             and ev["start"].date() == today
         ]
     except Exception:
@@ -142,16 +221,9 @@ def _events_next_7(modules: dict) -> list:
     """High-impact events in the next 7 days."""
     try:
         HIGH   = {"FOMC", "CPI", "NFP", "ECB", "PPI"}
-        events = modules["fedwatch"].STATE.get("events", [])
         now    = datetime.now(timezone.utc)
-        cutoff = now + timedelta(days=7)
-        upcoming = [
-            ev for ev in events
-            if ev.get("category") in HIGH
-            and ev.get("start")
-            and now < ev["start"] <= cutoff
-        ]
-        return sorted(upcoming, key=lambda e: e["start"])[:3]
+        events = modules["fedwatch"].events_between(now, now + timedelta(days=7))
+        return [ev for ev in events if ev.get("category") in HIGH][:3]
     except Exception:
         return []
 
@@ -167,6 +239,39 @@ def _vix_line(modules: dict) -> str | None:
         return None
 
 
+# ~60 words ≈ 80 tokens, plus the JSON wrapper and some headroom
+AI_SUMMARY_MAX_TOKENS = 150
+
+_TRUNCATED_SUMMARY_RE = re.compile(r'"summary"\s*:\s*"((?:[^"\\]|\\.)*)')
+# A cut can land inside a \uXXXX escape or between the halves of a surrogate pair
+_DANGLING_ESCAPE_RE   = re.compile(r'\\u(?:[dD][89abAB][0-9a-fA-F]{2}|[0-9a-fA-F]{0,3})$')
+
+
+def _decode_json_fragment(frag: str) -> str:
+    """Decode the body of a (possibly truncated) JSON string literal."""
+    while True:
+        trimmed = _DANGLING_ESCAPE_RE.sub("", frag)
+        if trimmed == frag:
+            break
+        frag = trimmed
+    try:
+        return _json_loads('"' + frag + '"')
+    except ValueError:
+        return frag.replace('\\"', '"')
+
+
+def _salvage_truncated_summary(content: str) -> str | None:
+    """Recover whole sentences from a {"summary": "..." reply cut off by max_tokens."""
+    m = _TRUNCATED_SUMMARY_RE.search(content or "")
+    if not m:
+        return None
+    text = _decode_json_fragment(m.group(1)).strip()
+    end  = max(text.rfind(". "), text.rfind("! "), text.rfind("? "))
+    if text.endswith((".", "!", "?")):
+        end = len(text) - 1
+    return text[:end + 1].strip() if end >= 0 else None
+
+
 def _ai_summary(context: str) -> str | None:
     """Optional AI narrative for evening recap. Falls back gracefully."""
     if not OPENAI_API_KEY:
@@ -177,20 +282,23 @@ def _ai_summary(context: str) -> str | None:
             headers={"Authorization": f"Bearer {OPENAI_API_KEY}"},
             json={
                 "model":       OPENAI_MODEL,
-                "max_tokens":  120,
+                "max_tokens":  AI_SUMMARY_MAX_TOKENS,
                 "temperature": 0.4,
-                "messages": [{
-                    "role": "user",
-                    "content": (
-                        "Write a 2-sentence plain-English summary of today's crypto market "
-                        "for a private investor group. No jargon. No hype. Factual only.\n\n"
-                        f"Context:\n{context}"
-                    ),
-                }],
+                "response_format": _AI_SUMMARY_FORMAT,
+                "messages": [
+                    {"role": "system", "content": _AI_SUMMARY_SYSTEM},
+                    {"role": "user",   "content": f"Context:\n{context}"},
+                ],
             },
             timeout=20,
         )
-        return r.json()["choices"][0]["message"]["content"].strip()
+        choice  = r.json()["choices"][0]
+        content = choice["message"]["content"]
+        if choice.get("finish_reason") == "length":
+            # Cut off mid-JSON — keep the complete sentences written so far
+            log.warning("AI summary hit max_tokens — using truncated text")
+            return _salvage_truncated_summary(content)
+        return _json_loads(content)["summary"].strip() or None
     except Exception as e:
         log.warning(f"AI summary failed: {e}")
         return None
@@ -209,11 +317,11 @@ def send_morning_brief(modules: dict):
     _daily_state["btc_open"] = btc
     _daily_state["eth_open"] = eth
 
-    btc_f = f"${btc:,.0f}" if btc else "N/A"
-    eth_f = f"${eth:,.2f}" if eth else "N/A"
-
     funding_btc = _fetch_funding("BTCUSDT")
-    f_btc = f"{funding_btc*100:.4f}%/8h" if funding_btc is not None else "N/A"
+    disp  = _derive_display(btc, eth, funding_btc)
+    btc_f = disp["btc_str"]
+    eth_f = disp["eth_str"]
+    f_btc = disp["funding_str"]
     f_apr = funding_btc * 3 * 365 * 100 if funding_btc is not None else None
     f_crowd = ""
     if f_apr is not None:
@@ -296,15 +404,11 @@ def send_evening_recap(modules: dict):
     btc_chg = _chg(btc_now, btc_open)
     eth_chg = _chg(eth_now, eth_open)
 
-    def _fmt_price(price, chg):
-        if not price:
-            return "N/A"
-        chg_s = f" ({'+' if chg >= 0 else ''}{chg:.2f}%)" if chg is not None else ""
-        sym   = "₿" if "BTC" in str(price) else ""
-        return f"${price:,.0f}{chg_s}" if price > 1000 else f"${price:,.2f}{chg_s}"
-
-    btc_f = f"${btc_now:,.0f}{f' ({btc_chg:+.2f}%)' if btc_chg is not None else ''}" if btc_now else "N/A"
-    eth_f = f"${eth_now:,.2f}{f' ({eth_chg:+.2f}%)' if eth_chg is not None else ''}" if eth_now else "N/A"
+    funding_btc = _fetch_funding("BTCUSDT")
+    disp  = _derive_display(btc_now, eth_now, funding_btc, btc_chg, eth_chg)
+    btc_f = disp["btc_str"]
+    eth_f = disp["eth_str"]
+    f_btc = disp["funding_str"]
 
     regime  = _regime_label(modules)
     r_emoji = _regime_emoji(regime)
@@ -322,17 +426,13 @@ def send_evening_recap(modules: dict):
     fed_fired = _daily_state.get("fedwatch_fired", [])
     fed_line  = f"🏦 FedWatch: {', '.join(fed_fired)}" if fed_fired else "🏦 FedWatch: no events"
 
-    # Funding
-    funding_btc = _fetch_funding("BTCUSDT")
-    f_btc = f"{funding_btc*100:.4f}%/8h" if funding_btc is not None else "N/A"
-
     # Build context for AI summary
-    context = (
-        f"BTC: {btc_f}, ETH: {eth_f}, Regime: {regime}, "
-        f"Funding: {f_btc}, {trump_line}, {fed_line}"
+    context = _AI_CONTEXT_FMT.format(
+        btc=btc_f, eth=eth_f, regime=regime, fnd=f_btc,
+        trump=trump_count,
+        fed=",".join(fed_fired) or "none",
+        move=f"{btc_chg:+.1f}%" if notable else "-",
     )
-    if notable:
-        context += f", {notable}"
 
     ai = _ai_summary(context)
 
@@ -23,15 +23,26 @@ Architecture fix vs original:
 import os
 import re
 import time
-import json
+import heapq
+import bisect
+import hashlib
+import functools
 import logging
+import itertools
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 
 from bot.utils import send_text
 from bot.datafeed_bitget import get_ticker
 
+try:
+    from orjson import loads as _json_loads   # faster C parser, stdlib fallback below
+except ImportError:
+    from json import loads as _json_loads
+
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(name)s] %(message)s")
 log = logging.getLogger("fedwatch")
 
@@ -48,6 +59,7 @@ ALERT_OFFSETS = [
     ("T-24h", timedelta(hours=24)),
     ("T-15m", timedelta(minutes=15)),
 ]
+_ALERT_OFFSETS_S = [(label, int(delta.total_seconds())) for label, delta in ALERT_OFFSETS]
 
 BTC_SYM = "BTCUSDT_UMCBL"
 ETH_SYM = "ETHUSDT_UMCBL"
@@ -65,14 +77,30 @@ BLS_NFP_SERIES  = "CES0000000001"  # Total Nonfarm Payrolls
 # ZQ futures: price = 100 - implied fed funds rate
 YAHOO_ZQ_URL = "https://query1.finance.yahoo.com/v8/finance/chart/ZQ=F?interval=1d&range=1d"
 
+# Pooled keep-alive session shared by the Fed and Yahoo fetches
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "Mozilla/5.0"})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=2))
+
 STATE = {
     "events":          [],
-    "alert_queue":     [],
+    "starts_ts":       [],      # parallel to events (sorted), for bisect
+    "event_keys":      set(),   # (title, start) keys of the current events
+    "alert_queue":     [],      # min-heap of (when_ts: int, seq, label, event)
     "fired_alerts":    set(),   # set of (event_id, label) already sent
+    "queue_built":     False,   # set after the first _rebuild_queues since startup
     "warned":          False,
     "source_ok":       False,
-    "last_refresh":    None,
+    "last_refresh":    None,    # wall-clock datetime, for display
+    "refresh_mono":    None,    # monotonic time of the last refresh attempt
+    "refresh_ok":      False,   # whether that attempt reached the Fed page
+    "refresh_failures": 0,      # consecutive failed attempts, for retry backoff
+    "fomc_fetch_ok":   False,   # whether the last Fed page request succeeded
     "last_poll":       None,
+    "fomc_etag":       None,    # validators from the last 200 on the Fed page
+    "fomc_modified":   None,
+    "fomc_hash":       None,    # body digest, for servers that ignore validators
+    "fomc_events":     [],      # events parsed from that response
 }
 
 # ─── Helpers ─────────────────────────────────────────────────────────────────
@@ -81,7 +109,12 @@ def _now() -> datetime:
     return datetime.now(timezone.utc)
 
 def _fmt(dt: datetime) -> str:
-    return dt.astimezone(BRUSSELS_TZ).strftime("%Y-%m-%d %H:%M %Z")
+    return _fmt_epoch(int(dt.timestamp()))
+
+@functools.lru_cache(maxsize=1024)
+def _fmt_epoch(ts: int) -> str:
+    # Event starts sit on the minute and recur across refreshes/renders
+    return datetime.fromtimestamp(ts, BRUSSELS_TZ).strftime("%Y-%m-%d %H:%M %Z")
 
 def _event_id(ev: dict) -> str:
     return f"{ev['title']}|{ev['start'].isoformat()}"
@@ -94,11 +127,7 @@ CURRENT_RATE_PCT = float(os.getenv("FW_CURRENT_RATE", "3.50"))  # Fed funds rate
 def _fetch_zq_price() -> float | None:
     """Fetch front-month ZQ (30-Day Fed Funds Futures) price from Yahoo Finance."""
     try:
-        r = requests.get(
-            YAHOO_ZQ_URL,
-            headers={"User-Agent": "Mozilla/5.0"},
-            timeout=8
-        )
+        r = _SESSION.get(YAHOO_ZQ_URL, timeout=8)
         r.raise_for_status()
         data   = r.json()
         closes = data["chart"]["result"][0]["indicators"]["quote"][0]["close"]
@@ -196,6 +225,14 @@ FOMC_FALLBACK_DATES = [
 ]
 
 
+# Month name → number for the scrapers (strptime("%B") per match is slow and locale-bound)
+_MONTHS = {
+    name: i for i, name in enumerate(
+        ("January", "February", "March", "April", "May", "June", "July",
+         "August", "September", "October", "November", "December"), start=1)
+}
+
+
 def _fomc_fallback_events() -> list:
     """Known FOMC decision dates as a guaranteed baseline (HTML-scrape-independent)."""
     events = []
@@ -217,57 +254,105 @@ def _fomc_fallback_events() -> list:
     return events
 
 
+# Year section header or a meeting date ("June 16-17*"); the day must not run
+# into further digits so "January 2026 FOMC Meetings" stays a header.
+_FOMC_RE = re.compile(
+    r"(?P<year>\d{4})\s+FOMC Meetings"
+    r"|(?P<month>January|February|March|April|May|June|July|August|"
+    r"September|October|November|December)\s+(?P<d1>\d{1,2})(?!\d)(?:-(?P<d2>\d{1,2})\*?)?"
+)
+
+
+# Powell testimonies / speeches mentioned on the calendar page
+_SPEECH_RE = re.compile(
+    r"(Chair|Governor|Vice Chair).{0,60}(testif|speech|speak|remarks|deliver).{0,100}"
+    r"(January|February|March|April|May|June|July|August|September|October|November|December)"
+    r"\s+(\d{1,2}),?\s+(\d{4})",
+    re.IGNORECASE
+)
+_WS_RE = re.compile(r"\s+")
+
+
 def _fetch_fomc_events() -> list:
+    # Conditional GET: the calendar page changes a few times a year, so a
+    # 304 lets us reuse the last parse instead of re-scraping the HTML.
+    headers = {}
+    if STATE["fomc_etag"]:
+        headers["If-None-Match"] = STATE["fomc_etag"]
+    if STATE["fomc_modified"]:
+        headers["If-Modified-Since"] = STATE["fomc_modified"]
+    STATE["fomc_fetch_ok"] = False
     try:
-        r = requests.get(FED_HTML_URL, timeout=12,
-                         headers={"User-Agent": "Mozilla/5.0"})
-        r.raise_for_status()
-        html = r.text
+        with _SESSION.get(FED_HTML_URL, timeout=12, headers=headers) as r:
+            if r.status_code == 304:
+                STATE["fomc_fetch_ok"] = True
+                log.info("FOMC HTML unchanged (304) — reusing last parse")
+                return STATE["fomc_events"]
+            r.raise_for_status()
+            html     = r.text
+            etag     = r.headers.get("ETag")
+            modified = r.headers.get("Last-Modified")
+        STATE["fomc_fetch_ok"] = True
     except Exception as e:
         log.warning(f"FOMC HTML fetch failed: {e}")
         return []
 
-    events = []
-    text   = re.sub(r"\s+", " ", html)
+    digest = hashlib.blake2b(html.encode("utf-8", "replace"), digest_size=16).digest()
+    if digest == STATE["fomc_hash"]:
+        # Same body, but the server may have rotated its validators — keep them
+        # current or every later request misses the 304 and re-downloads.
+        if etag:
+            STATE["fomc_etag"] = etag
+        if modified:
+            STATE["fomc_modified"] = modified
+        log.info("FOMC HTML unchanged (same digest) — reusing last parse")
+        return STATE["fomc_events"]
 
-    year_matches = list(re.finditer(r"(\d{4})\s+FOMC Meetings", text))
-    for idx, m in enumerate(year_matches):
-        year    = int(m.group(1))
-        section = text[m.end(): (year_matches[idx+1].start() if idx+1 < len(year_matches) else len(text))]
+    events = []
+    text   = _WS_RE.sub(" ", html)
+
+    # Meeting dates only appear after the first year header; everything before
+    # it is <head>, scripts and nav, so start the FOMC scan there. Back up a
+    # little so the header's own "YYYY " is kept. The speech scan below still
+    # covers the whole page.
+    first = text.find("FOMC Meetings")
+    start = max(0, first - 16) if first > 0 else 0
+
+    # One pass: year headers set the current year, meeting dates after them
+    # belong to it. Dates before the first header are ignored.
+    year = None
+    seen = set()      # the page repeats meetings (e.g. minutes links); emit each once
+    for m in _FOMC_RE.finditer(text, start):
+        if m.group("year"):
+            year = int(m.group("year"))
+            continue
+        if year is None:
+            continue
+        d2 = int(m.group("d2") or m.group("d1"))
+        key = (year, m.group("month"), d2)
+        if key in seen:
+            continue
+        seen.add(key)
+        try:
+            base = datetime(year, _MONTHS[m.group("month")], d2, tzinfo=ET_TZ)
+        except Exception:
+            continue
 
-        md_pat = re.compile(
-            r"(January|February|March|April|May|June|July|August|"
-            r"September|October|November|December)\s+(\d{1,2})(?:-(\d{1,2})\*?)?"
-        )
-        for md in md_pat.finditer(section):
-            month_name = md.group(1)
-            d2         = int(md.group(3) or md.group(2))
-            try:
-                base = datetime(year, datetime.strptime(month_name, "%B").month, d2, tzinfo=ET_TZ)
-            except Exception:
-                continue
-
-            for title, hour, minute in [
-                ("FOMC Statement",      14, 0),
-                ("FOMC Press Conference", 14, 30),
-            ]:
-                events.append({
-                    "title":    title,
-                    "start":    base.replace(hour=hour, minute=minute).astimezone(timezone.utc),
-                    "category": "FOMC",
-                    "location": "Federal Reserve",
-                })
+        for title, hour, minute in [
+            ("FOMC Statement",      14, 0),
+            ("FOMC Press Conference", 14, 30),
+        ]:
+            events.append({
+                "title":    title,
+                "start":    base.replace(hour=hour, minute=minute).astimezone(timezone.utc),
+                "category": "FOMC",
+                "location": "Federal Reserve",
+            })
 
     # Also check for Powell testimonies / speeches in the HTML
-    speech_pat = re.compile(
-        r"(Chair|Governor|Vice Chair).{0,60}(testif|speech|speak|remarks|deliver).{0,100}"
-        r"(January|February|March|April|May|June|July|August|September|October|November|December)"
-        r"\s+(\d{1,2}),?\s+(\d{4})",
-        re.IGNORECASE
-    )
-    for sp in speech_pat.finditer(text):
+    for sp in _SPEECH_RE.finditer(text):
         try:
-            month = datetime.strptime(sp.group(3), "%B").month
+            month = _MONTHS[sp.group(3).capitalize()]
             day   = int(sp.group(4))
             year_ = int(sp.group(5))
             dt    = datetime(year_, month, day, 10, 0, tzinfo=ET_TZ).astimezone(timezone.utc)
@@ -281,6 +366,10 @@ def _fetch_fomc_events() -> list:
             continue
 
     log.info(f"FOMC events parsed: {len(events)}")
+    STATE["fomc_etag"]     = etag
+    STATE["fomc_modified"] = modified
+    STATE["fomc_hash"]     = digest
+    STATE["fomc_events"]   = events
     return events
 
 
@@ -367,63 +456,121 @@ def _fetch_ecb_events() -> list:
 
 def refresh_calendar():
     log.info("Refreshing calendar...")
-    all_events = []
+    STATE["refresh_mono"] = time.monotonic()
+    STATE["refresh_ok"]   = False
+    STATE["refresh_failures"] += 1     # reset below once the Fed page is reached
+    uniq: dict = {}   # (title, start) → event; first source wins
+
+    def _merge(evs: list):
+        for e in evs:
+            uniq.setdefault((e["title"], e["start"]), e)
 
-    # FOMC: HTML scrape + hardcoded fallback (merged & deduped below).
+    # FOMC: HTML scrape + hardcoded fallback (deduped as they're merged).
     # The fallback guarantees known FOMC dates are present even if the
     # Fed HTML structure changes and the scrape returns nothing.
     scraped_fomc = _fetch_fomc_events()
-    all_events += scraped_fomc
-    all_events += _fomc_fallback_events()
+    _merge(scraped_fomc)
+    _merge(_fomc_fallback_events())
     log.info(f"FOMC: {len(scraped_fomc)} scraped + {len(FOMC_FALLBACK_DATES)*2} fallback")
+    if STATE["fomc_fetch_ok"] and not scraped_fomc:
+        # Page reachable but nothing matched — likely a layout change. The
+        # fallback dates cover it; re-fetching sooner wouldn't help.
+        log.warning("FOMC scrape matched no meetings — relying on fallback dates")
 
     # BLS economic releases
     for rtype in ["CPI", "PPI", "NFP"]:
-        all_events += _fetch_bls_dates(rtype)
+        _merge(_fetch_bls_dates(rtype))
 
     # ECB
-    all_events += _fetch_ecb_events()
+    _merge(_fetch_ecb_events())
 
-    if not all_events:
+    if not uniq:
         STATE["source_ok"] = False
         if not STATE["warned"]:
             send_text("🏦 [FedWatch] ⚠️ Calendar refresh returned 0 events — sources may be down.")
             STATE["warned"] = True
         return
 
-    STATE["source_ok"] = True
-    STATE["warned"]    = False
+    STATE["source_ok"]  = True
+    STATE["warned"]     = False
+    # Fallback dates keep the calendar populated when the fetch fails, so retry
+    # (with backoff) rather than waiting out the full interval. A reachable page
+    # that parses to nothing still counts as OK — see the warning above.
+    STATE["refresh_ok"] = STATE["fomc_fetch_ok"]
+    if STATE["refresh_ok"]:
+        STATE["refresh_failures"] = 0
+
+    # Same (title, start) set as last time → keep the existing sorted list and
+    # its derived fields; only the alert queue needs rebuilding.
+    changed = uniq.keys() != STATE["event_keys"]
+    if changed:
+        events = sorted(uniq.values(), key=lambda e: e["start"])
+        # Derive once here so queue rebuilds are plain float arithmetic
+        for ev in events:
+            ev["_id"]       = _event_id(ev)
+            ev["_start_ts"] = ev["start"].timestamp()
+    else:
+        events = STATE["events"]
+
+    with _STATE_LOCK:
+        if changed:
+            STATE["events"]     = events
+            STATE["starts_ts"]  = [ev["_start_ts"] for ev in events]
+            STATE["event_keys"] = set(uniq)
+        STATE["last_refresh"] = _now()
+        # Past events never re-queue, so their fired keys can go — otherwise
+        # the set grows for as long as the process lives.
+        now_ts = STATE["last_refresh"].timestamp()
+        live   = {ev["_id"] for ev in events if ev["_start_ts"] > now_ts}
+        STATE["fired_alerts"] = {k for k in STATE["fired_alerts"] if k[0] in live}
+        _rebuild_queues()
+    log.info(f"Calendar refreshed: {len(events)} total events"
+             f"{'' if changed else ' (unchanged)'}")
+
+
+# Set whenever the queue is rebuilt (e.g. /fedwatch forcing a refresh) so a
+# sleeping schedule_loop re-evaluates its next deadline.
+_WAKE = threading.Event()
 
-    # Deduplicate by (title, start)
-    uniq   = {(e["title"], e["start"]): e for e in all_events}
-    events = sorted(uniq.values(), key=lambda e: e["start"])
+# Guards the events/queue swap in refresh_calendar against poll_once draining
+# the queue concurrently (APScheduler job vs. /fedwatch command thread).
+_STATE_LOCK = threading.RLock()
 
-    STATE["events"]       = events
-    STATE["last_refresh"] = _now()
+# Alerts that came due this recently but haven't fired are kept on rebuild;
+# otherwise a refresh landing between two polls would silently drop them.
+# Must exceed the poll interval (5 min in main.py).
+ALERT_GRACE_S = 600
 
-    _rebuild_queues()
-    log.info(f"Calendar refreshed: {len(events)} total events")
+# Tie-breaker so heap entries with equal timestamps never compare the event dicts
+_ALERT_SEQ = itertools.count()
 
 
 def _rebuild_queues():
     alerts = []
-    now    = _now()
+    now_ts = _now().timestamp()
+    # fired_alerts is in-memory only: on the first build after a (re)start it
+    # is empty, so a grace window would re-send anything fired just before.
+    floor  = now_ts - ALERT_GRACE_S if STATE["queue_built"] else now_ts
+    fired  = STATE["fired_alerts"]
 
     for ev in STATE["events"]:
         # Only high-impact events get the full briefing cycle
         if ev.get("category") not in HIGH_IMPACT_CATEGORIES:
             continue
-        if ev["start"] <= now:
+        start_ts = ev["_start_ts"]
+        if start_ts <= now_ts:
             continue
-        ev_id = _event_id(ev)
 
-        for label, delta in ALERT_OFFSETS:
-            when = ev["start"] - delta
-            if when > now:
-                alerts.append({"when": when, "label": label, "event": ev, "event_id": ev_id})
+        for label, delta_s in _ALERT_OFFSETS_S:
+            when_ts = int(start_ts - delta_s)
+            if when_ts > now_ts or (when_ts > floor and (ev["_id"], label) not in fired):
+                alerts.append((when_ts, next(_ALERT_SEQ), label, ev))
 
-    alerts.sort(key=lambda a: a["when"])
-    STATE["alert_queue"] = alerts
+    heapq.heapify(alerts)
+    with _STATE_LOCK:
+        STATE["alert_queue"] = alerts
+        STATE["queue_built"] = True
+    _WAKE.set()
 
 
 # ─── Pre-event price capture ─────────────────────────────────────────────────
@@ -463,7 +610,6 @@ Be specific. No fluff. No emojis. No disclaimers. JSON only."""
 
     try:
         import requests as _req
-        import json
         r = _req.post(
             "https://api.openai.com/v1/chat/completions",
             headers={"Authorization": f"Bearer {OPENAI_API_KEY}"},
@@ -477,7 +623,7 @@ Be specific. No fluff. No emojis. No disclaimers. JSON only."""
             timeout=15,
         )
         text = r.json()["choices"][0]["message"]["content"].strip()
-        return json.loads(text)
+        return _json_loads(text)
     except Exception as e:
         log.warning(f"AI pre-event brief failed: {e}")
         return {}
@@ -504,16 +650,20 @@ def _cat_emoji(ev: dict) -> str:
 # the private group (CHAT_ID).
 
 
-def _send_alert(alert: dict):
-    ev      = alert["event"]
-    label   = alert["label"]
-    ev_id   = alert["event_id"]
-    fire_key = (ev_id, label)
+# Combined digests stay under Telegram's 4096-char message limit
+_DIGEST_MAX_LEN = 4000
+_DIGEST_SEP     = "\n\n━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
 
-    if fire_key in STATE["fired_alerts"]:
-        return
-    STATE["fired_alerts"].add(fire_key)
-    _save_persisted_state()
+
+def _render_alert(entry: tuple) -> str | None:
+    """Build the message for a due queue entry, or None if it already fired."""
+    _, _, label, ev = entry
+    fire_key = (ev["_id"], label)
+
+    with _STATE_LOCK:   # poll_once may run from two scheduler jobs at once
+        if fire_key in STATE["fired_alerts"]:
+            return None
+        STATE["fired_alerts"].add(fire_key)
 
     emoji    = _cat_emoji(ev)
     category = ev.get("category", "")
@@ -565,8 +715,7 @@ def _send_alert(alert: dict):
                 lines.append(_rate_prob_line())
             lines.append("_High-impact event ahead — expect volatility._")
 
-        send_text("\n".join(lines))
-        return
+        return "\n".join(lines)
 
     # ── T-15m: Quick final reminder ────────────────────────────────────────
     if label == "T-15m":
@@ -580,33 +729,82 @@ def _send_alert(alert: dict):
         lines.append("")
         lines.append("_Strap in._ 🎢")
 
-        send_text("\n".join(lines))
-        return
+        return "\n".join(lines)
+
+    return None
+
+
+def _send_alerts(alerts: list):
+    """Send due alerts, packing several into one message when they fire together."""
+    texts = [t for t in map(_render_alert, alerts) if t]
+    batch = ""
+    for text in texts:
+        if batch and len(batch) + len(_DIGEST_SEP) + len(text) > _DIGEST_MAX_LEN:
+            send_text(batch)
+            batch = ""
+        batch = f"{batch}{_DIGEST_SEP}{text}" if batch else text
+    if batch:
+        send_text(batch)
 
 
 # ─── poll_once — called by APScheduler ───────────────────────────────────────
 
 REFRESH_INTERVAL_H = int(os.getenv("FW_REFRESH_HOURS", "6"))
+REFRESH_INTERVAL_S = REFRESH_INTERVAL_H * 3600
+FAILED_RETRY_S     = 60     # first retry after a failed fetch; doubles per failure
+
+def _next_refresh_in(mono: float) -> float:
+    """Seconds until the calendar is due for a refresh (≤ 0 means now)."""
+    last = STATE["refresh_mono"]
+    if last is None:
+        return 0.0
+    if STATE["refresh_ok"]:
+        interval = REFRESH_INTERVAL_S
+    else:
+        backoff  = FAILED_RETRY_S * 2 ** min(max(STATE["refresh_failures"] - 1, 0), 16)
+        interval = min(REFRESH_INTERVAL_S, backoff)
+    return last + interval - mono
+
 
 def poll_once():
     """APScheduler entrypoint. Check queues and refresh calendar periodically."""
-    now = _now()
-    STATE["last_poll"] = now
+    # Epoch floats and the monotonic clock only; datetimes are built when rendering
+    now_ts = int(time.time())
+    STATE["last_poll"] = now_ts
 
     # Refresh calendar if stale or empty
-    if (not STATE["events"]
-            or STATE["last_refresh"] is None
-            or (now - STATE["last_refresh"]) > timedelta(hours=REFRESH_INTERVAL_H)):
+    if _next_refresh_in(time.monotonic()) <= 0:
         refresh_calendar()
 
-    # Fire due alerts
-    fired_any = False
-    while STATE["alert_queue"] and now >= STATE["alert_queue"][0]["when"]:
-        _send_alert(STATE["alert_queue"].pop(0))
-        fired_any = True
+    # Pop due alerts under the lock, send outside it (sends hit the network)
+    due = []
+    with _STATE_LOCK:
+        q = STATE["alert_queue"]
+        while q and q[0][0] <= now_ts:
+            due.append(heapq.heappop(q))
+
+    if due:
+        _send_alerts(due)
+        log.info(f"Alerts fired this poll: {len(due)}")
 
-    if fired_any:
-        log.info("Alerts fired this poll")
+
+def events_between(after: datetime, until: datetime | None = None) -> list:
+    """Events with after < start <= until, in start order.
+
+    Bisects the sorted starts_ts column instead of scanning the event dicts.
+    """
+    with _STATE_LOCK:
+        events, starts = STATE["events"], STATE["starts_ts"]
+    lo = bisect.bisect_right(starts, after.timestamp())
+    hi = len(starts) if until is None else bisect.bisect_right(starts, until.timestamp())
+    return events[lo:hi]
+
+
+def next_alert_ts() -> int | None:
+    """Epoch time of the next queued alert, for schedulers to wake on."""
+    with _STATE_LOCK:
+        q = STATE["alert_queue"]
+        return q[0][0] if q else None
 
 
 # ─── Commands ────────────────────────────────────────────────────────────────
@@ -615,7 +813,7 @@ def show_next_event():
     if not STATE["events"]:
         refresh_calendar()
     now = _now()
-    up  = [e for e in STATE["events"] if e["start"] > now]
+    up  = events_between(now)
     if not up:
         send_text("🏦 [FedWatch] No upcoming events found.")
         return
@@ -637,7 +835,7 @@ def show_diag(n: int = 8):
         refresh_calendar()
 
     now      = _now()
-    upcoming = [e for e in STATE["events"] if e["start"] > now][:n]
+    upcoming = events_between(now)[:n]
 
     # Group by category for clarity
     by_cat: dict = {}
@@ -670,9 +868,23 @@ def show_diag(n: int = 8):
 
 # ─── Legacy: standalone loop (kept for backwards compat) ─────────────────────
 
+def _seconds_until_next_wakeup() -> float:
+    """Time until the next queued alert or calendar refresh, whichever is first."""
+    wait    = _next_refresh_in(time.monotonic())
+    next_ts = next_alert_ts()   # locked read; the queue is swapped from other threads
+    if next_ts is not None:
+        wait = min(wait, next_ts - time.time())
+    return max(1.0, wait)
+
+
 def schedule_loop():
-    """Blocking loop — use only when running FedWatch standalone, not with APScheduler."""
+    """Blocking loop — use only when running FedWatch standalone, not with APScheduler.
+
+    Alert times are known as soon as the calendar is built, so sleep straight
+    to the next one (or the next refresh) instead of waking every 30s.
+    """
     refresh_calendar()
     while True:
         poll_once()
-        time.sleep(30)
+        _WAKE.clear()
+        _WAKE.wait(_seconds_until_next_wakeup())
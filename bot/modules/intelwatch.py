@@ -127,13 +127,8 @@ def _evaluate_signals(modules: dict) -> dict:
 
     # ── FedWatch — weight: ±2 if event <3h, otherwise just info
     try:
-        fw_events = modules["fedwatch"].STATE.get("events", [])
-        next_event = None
-        for ev in fw_events:
-            start = ev.get("start")
-            if start and start > now:
-                next_event = ev
-                break
+        upcoming   = modules["fedwatch"].events_between(now)
+        next_event = upcoming[0] if upcoming else None
         if next_event:
             delta_h = (next_event["start"] - now).total_seconds() / 3600
             impact  = (next_event.get("impact") or "medium").lower()
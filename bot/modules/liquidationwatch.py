@@ -13,6 +13,7 @@ Polls every 2 minutes. Cooldown 15min per asset per side to avoid spam.
 
 import logging
 import os
+from collections import deque
 from datetime import datetime, timezone, timedelta
 
 import requests
@@ -38,6 +39,7 @@ STATE = {
     "last_check":    None,
     "last_alert":    {},   # { "ETHUSDT_LONG": datetime, ... }
     "seen_ids":      set(),  # dedup by order ID
+    "seen_order":    deque(maxlen=5000),  # insertion order of seen_ids, oldest evicted first
     "stats":         {},   # { symbol: { "long_liqs": int, "short_liqs": int } }
 }
 
@@ -92,10 +94,12 @@ def poll_once():
             if order_id and order_id in STATE["seen_ids"]:
                 continue
             if order_id:
+                # Bounded cache: evict the oldest ID as each new one comes in
+                order = STATE["seen_order"]
+                if len(order) == order.maxlen:
+                    STATE["seen_ids"].discard(order[0])
+                order.append(order_id)
                 STATE["seen_ids"].add(order_id)
-                # Keep set from growing unbounded
-                if len(STATE["seen_ids"]) > 5000:
-                    STATE["seen_ids"] = set(list(STATE["seen_ids"])[-2000:])
 
             # Parse fields — Binance returns either flat or nested under "o"
             data     = liq.get("o") or liq
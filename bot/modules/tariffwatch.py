@@ -131,7 +131,7 @@ def _dedup_mark(key: str):
 # ─── Helpers ─────────────────────────────────────────────────────────────────
 
 def _now_iso() -> str:
-    return datetime.utcnow().isoformat(timespec="minutes")
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M")
 
 def _url_key(url: str) -> str:
     m = re.search(r"/(\d{4,})/?$", (url or "").split("?")[0])
@@ -20,6 +20,7 @@ import re
 from datetime import datetime, timedelta, timezone
 from xml.etree import ElementTree as ET
 from collections import deque
+from itertools import islice
 
 from bot.utils import send_text
 
@@ -343,7 +344,7 @@ def _fallback_score(text: str) -> dict:
 # ─── Normalisation & Dedup ───────────────────────────────────────────────────
 
 def _now_iso() -> str:
-    return datetime.utcnow().isoformat(timespec="minutes")
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M")
 
 
 def _norm(s: str) -> str:
@@ -501,14 +502,12 @@ def show_recent():
 
 # ─── Sentiment trend ─────────────────────────────────────────────────────────
 
-SENTIMENT_LOG: list = []   # [{"sentiment": "bullish", "score": 8, "ts": "..."}, ...]
 SENTIMENT_MAX = 50
+SENTIMENT_LOG: deque = deque(maxlen=SENTIMENT_MAX)   # [{"sentiment": "bullish", "score": 8, "ts": "..."}, ...]
 
 
 def _log_sentiment(sentiment: str, score: int):
     SENTIMENT_LOG.append({"sentiment": sentiment, "score": score, "ts": _now_iso()})
-    if len(SENTIMENT_LOG) > SENTIMENT_MAX:
-        SENTIMENT_LOG.pop(0)
 
 
 def show_sentiment():
@@ -533,7 +532,7 @@ def show_sentiment():
     else:
         bias = "🔵 Mixed / No Clear Bias"
 
-    recent = list(reversed(SENTIMENT_LOG[-5:]))
+    recent = list(islice(reversed(SENTIMENT_LOG), 5))
     recent_lines = []
     for r in recent:
         e = "🟢" if r["sentiment"] == "bullish" else ("🔴" if r["sentiment"] == "bearish" else "🔵")
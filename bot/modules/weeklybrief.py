@@ -34,6 +34,9 @@ COINGECKO_BASE = "https://api.coingecko.com/api/v3"
 BITGET_BASE    = "https://api.bitget.com"
 PRODUCT_TYPE   = os.getenv("BITGET_PRODUCT_TYPE", "USDT-FUTURES")
 
+# Fear & Greed 0-100 → dot colour (<45 🔴, 45-54 🟠, 55-74 🟡, ≥75 🟢)
+_FG_EMOJI = ("🔴",) * 45 + ("🟠",) * 10 + ("🟡",) * 20 + ("🟢",) * 26
+
 
 # ─── Data fetchers ────────────────────────────────────────────────────────────
 
@@ -328,13 +331,8 @@ def _fetch_global_history() -> dict:
 def _fetch_upcoming_macro(modules: dict, days: int = 14) -> list:
     """Get upcoming macro events from FedWatch for next N days."""
     try:
-        events = modules["fedwatch"].STATE.get("events", [])
-        now    = datetime.now(timezone.utc)
-        cutoff = now + timedelta(days=days)
-        upcoming = [ev for ev in events
-                    if ev.get("start") and now < ev["start"] <= cutoff]
-        upcoming.sort(key=lambda e: e["start"])
-        return upcoming[:8]
+        now = datetime.now(timezone.utc)
+        return modules["fedwatch"].events_between(now, now + timedelta(days=days))[:8]
     except Exception as e:
         log.warning(f"Upcoming macro fetch failed: {e}")
         return []
@@ -684,10 +682,7 @@ def build_weekly_brief(modules: dict, private: bool = False) -> str:
         # Group 3: Sentiment
         if fg.get("value"):
             val = fg["value"]
-            if val >= 75:   fg_emoji = "🟢"
-            elif val >= 55: fg_emoji = "🟡"
-            elif val >= 45: fg_emoji = "🟠"
-            else:           fg_emoji = "🔴"
+            fg_emoji = _FG_EMOJI[min(max(val, 0), 100)]
             lines.append(f"🎭 *Fear & Greed*  `{val}` — {fg_emoji} {fg['label']}")
             if fg_delta is not None:
                 sign = "+" if fg_delta >= 0 else ""
@@ -11,6 +11,7 @@ Default threshold: 1,000 ETH (configurable via WHALE_MIN_ETH env var).
 
 import logging
 import os
+from collections import deque
 from datetime import datetime, timezone
 
 import requests
@@ -62,6 +63,7 @@ KNOWN_LABELS = {
 
 STATE = {
     "seen_hashes": set(),   # dedup by tx hash
+    "seen_order":  deque(maxlen=5000),   # insertion order of seen_hashes, oldest evicted first
     "last_check_utc": None,
     "last_alert_utc": None,
     "total_fired": 0,
@@ -208,12 +210,13 @@ def poll_once():
         h = tx["hash"]
         if not h or h in STATE["seen_hashes"]:
             continue
+        # Bounded cache: evict the oldest hash as each new one comes in
+        order = STATE["seen_order"]
+        if len(order) == order.maxlen:
+            STATE["seen_hashes"].discard(order[0])
+        order.append(h)
         STATE["seen_hashes"].add(h)
 
-        # Trim cache to avoid unbounded growth
-        if len(STATE["seen_hashes"]) > 5000:
-            STATE["seen_hashes"] = set(list(STATE["seen_hashes"])[-2500:])
-
         from_lbl = _label(tx["from"])
         to_lbl   = _label(tx["to"])
         eth_fmt  = f"{tx['eth']:,.0f}"
@@ -1,7 +1,9 @@
 import os
+import json
 import time
 
 import requests
+from requests.adapters import HTTPAdapter
 
 TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN", "")
 CHAT_ID        = os.getenv("CHAT_ID", "")
@@ -14,6 +16,12 @@ _MAX_LEN = 4096
 # Max retries on 429 rate-limit responses
 _MAX_RETRIES = 3
 
+# One keep-alive session for all Telegram calls: the command loop long-polls
+# back to back and every module sends through here, so reuse the TLS socket.
+# A few connections so scheduler jobs can send while getUpdates is parked.
+_TG = requests.Session()
+_TG.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
 
 def send_text(text: str):
     if not TELEGRAM_TOKEN or not CHAT_ID:
@@ -33,7 +41,7 @@ def send_text(text: str):
 
     for attempt in range(1, _MAX_RETRIES + 1):
         try:
-            resp = requests.post(
+            resp = _TG.post(
                 f"{API_BASE}/sendMessage",
                 json=payload,
                 timeout=10,
@@ -61,16 +69,19 @@ def send_text(text: str):
     print("send_text: gave up after max retries")
 
 
-def get_updates(offset=None, timeout=20):
+def get_updates(offset=None, timeout=20, allowed_updates=None):
+    """Long-poll getUpdates. On any failure returns {"ok": False, "result": []}."""
     if not TELEGRAM_TOKEN:
-        return {"result": []}
+        return {"ok": False, "result": []}
 
     params = {"timeout": timeout}
     if offset is not None:
         params["offset"] = offset
+    if allowed_updates is not None:
+        params["allowed_updates"] = json.dumps(allowed_updates)
 
     try:
-        resp = requests.get(
+        resp = _TG.get(
             f"{API_BASE}/getUpdates",
             params=params,
             timeout=timeout + 5,
@@ -81,7 +92,7 @@ def get_updates(offset=None, timeout=20):
     except Exception as e:
         print(f"get_updates exception: {e}")
 
-    return {"result": []}
+    return {"ok": False, "result": []}
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -111,7 +122,7 @@ def send_buttons(text: str, buttons):
         "reply_markup": {"inline_keyboard": keyboard},
     }
     try:
-        resp = requests.post(f"{API_BASE}/sendMessage", json=payload, timeout=10)
+        resp = _TG.post(f"{API_BASE}/sendMessage", json=payload, timeout=10)
         if resp.ok:
             return resp.json()
         print(f"send_buttons error {resp.status_code}: {resp.text[:200]}")
@@ -133,7 +144,7 @@ def edit_message_text(message_id, text: str):
         "disable_web_page_preview": True,
     }
     try:
-        requests.post(f"{API_BASE}/editMessageText", json=payload, timeout=10)
+        _TG.post(f"{API_BASE}/editMessageText", json=payload, timeout=10)
     except Exception as e:
         print(f"edit_message_text exception: {e}")
 
@@ -146,6 +157,6 @@ def answer_callback_query(callback_query_id, text: str = ""):
     if text:
         payload["text"] = text
     try:
-        requests.post(f"{API_BASE}/answerCallbackQuery", json=payload, timeout=10)
+        _TG.post(f"{API_BASE}/answerCallbackQuery", json=payload, timeout=10)
     except Exception as e:
         print(f"answer_callback_query exception: {e}")